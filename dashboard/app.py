@@ -20,7 +20,7 @@ app = Dash(
 )
 
 # Layout
-app.layout = build_app_layout(AGENT_SPECS, data_manager.fetch_experiments())
+app.layout = build_app_layout(AGENT_SPECS)
 
 # Callbacks
 register_callbacks(app, data_manager, MODULE_TO_ATTR, AGENT_SPECS)
@@ -0,0 +1,38 @@
+/* Clientside callbacks for UI-only state (see dashboard/callbacks) */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+  figgie: {
+    // One style per agent block: the first `numPlayers` are shown
+    agentBlockStyles: function (numPlayers) {
+      var outputs = dash_clientside.callback_context.outputs_list;
+      return outputs.map(function (_, i) {
+        return { display: i < (numPlayers || 0) ? 'block' : 'none' };
+      });
+    },
+
+    // Mirrors the experiment summary panel: name, description, stats, created date
+    renderExperimentInfo: function (selected, experimentsById) {
+      var exp = selected && experimentsById ? experimentsById[String(selected)] : null;
+      if (!exp) {
+        return '';
+      }
+      function el(type, props) {
+        return { type: type, namespace: 'dash_html_components', props: props };
+      }
+      return el('Div', {
+        children: [
+          el('H4', { children: exp.name }),
+          el('P', { children: exp.description || 'No description' }),
+          el('Div', {
+            className: 'experiment-stats',
+            children: [
+              el('Span', { children: 'Games: ' + exp.total_games, className: 'stat' }),
+              el('Span', { children: 'Agents: ' + exp.configured_agents, className: 'stat' }),
+            ],
+          }),
+          el('Small', { children: 'Created: ' + exp.created_display }),
+        ],
+      });
+    },
+  },
+});
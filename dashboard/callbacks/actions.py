@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections import defaultdict
 from typing import Any, Dict, List, Tuple
 
 from dash import Dash, html
@@ -27,13 +28,23 @@ from dashboard.services.runner import (
     run_experiment_async,
     PreflightError,
 )
-from dashboard.config.agent_specs import validate_params, get_spec_by_module, AgentSpec
+from dashboard.config.agent_specs import validate_params, AgentSpec
 from dashboard.components.messages import success, error, error_list
 
 
 def register_action_callbacks(app: Dash, data_manager, module_to_attr: Dict[str, str], agent_specs: List[AgentSpec]):
     logger = logging.getLogger(__name__)
 
+    # Per module: the spec plus its (name, default) pairs, so a save does one
+    # lookup per agent instead of walking spec['params'] again
+    spec_meta: Dict[str, Tuple[AgentSpec, Tuple[Tuple[str, Any], ...]]] = {
+        spec['module']: (
+            spec,
+            tuple((p['name'], p.get('default')) for p in spec.get('params', []) if p.get('name')),
+        )
+        for spec in agent_specs
+    }
+
     @app.callback(
         Output(SAVE_OUTPUT, 'children'),
         Input(SAVE_BUTTON, 'n_clicks'),
@@ -59,17 +70,12 @@ def register_action_callbacks(app: Dash, data_manager, module_to_attr: Dict[str,
         if not name:
             return error("Experiment name is required")
 
-        mapping = dict(module_to_attr)
         errors: List[str] = []
 
-        id_to_value: Dict[str, Any] = {}
-        try:
-            for cid, val in zip(dyn_ids or [], dyn_values or []):
-                if isinstance(cid, dict):
-                    key = f"{cid.get('idx')}::{cid.get('name')}"
-                    id_to_value[key] = val
-        except Exception:
-            id_to_value = {}
+        # Bucket the dynamic param inputs by agent index once up front
+        values_by_agent: Dict[int, Dict[str, Any]] = defaultdict(dict)
+        for cid, val in zip(dyn_ids or (), dyn_values or ()):
+            values_by_agent[cid['idx']][cid['name']] = val
 
         validated_agents: List[Tuple[str, str, float, Dict[str, Any]]] = []
         for i in range(num_players or 0):
@@ -77,38 +83,38 @@ def register_action_callbacks(app: Dash, data_manager, module_to_attr: Dict[str,
             if not module:
                 errors.append(f"Agent {i+1}: Missing agent module")
                 continue
-            attr_name = mapping.get(module)
+            attr_name = module_to_attr.get(module)
             if not attr_name:
                 errors.append(f"Agent {i+1}: Unknown module '{module}'")
                 continue
+            agent_errors: List[str] = []
             raw_pr = polling_rates[i] if i < len(polling_rates) else None
             try:
                 pr_val = float(raw_pr) if raw_pr is not None else None
             except (TypeError, ValueError):
                 pr_val = None
             if pr_val is None or pr_val <= 0:
-                errors.append(f"Agent {i+1}: Polling rate is required and must be > 0")
+                agent_errors.append("Polling rate is required and must be > 0")
 
             # Use centralized validation
-            spec = get_spec_by_module(agent_specs, module)
-            if spec is not None:
-                # Build flat kwargs from collected ids
-                flat_kwargs: Dict[str, Any] = {}
-                for p in spec.get('params', []):
-                    pname = p.get('name')
-                    if not pname:
-                        continue
-                    key = f"{i+1}::{pname}"
-                    flat_kwargs[pname] = id_to_value.get(key, p.get('default'))
-                coerced, val_errors = validate_params(flat_kwargs, spec)
-                if val_errors:
-                    errors.extend([f"Agent {i+1}: {msg}" for msg in val_errors])
-                extra_kwargs = coerced
+            meta = spec_meta.get(module)
+            if meta is not None:
+                spec, param_defaults = meta
+                agent_values = values_by_agent.get(i + 1, {})
+                flat_kwargs: Dict[str, Any] = {
+                    pname: agent_values.get(pname, default)
+                    for pname, default in param_defaults
+                }
+                extra_kwargs, val_errors = validate_params(flat_kwargs, spec)
+                agent_errors.extend(val_errors)
             else:
                 extra_kwargs = {}
 
-            if not errors:
-                validated_agents.append((module, attr_name, float(pr_val), extra_kwargs))
+            if agent_errors:
+                errors.extend(f"Agent {i+1}: {msg}" for msg in agent_errors)
+            elif not errors:
+                # Once any agent is invalid the save is rejected, so stop collecting
+                validated_agents.append((module, attr_name, pr_val, extra_kwargs))
 
         if errors:
             return error_list("Invalid configuration. Please fix the following:", errors)
@@ -138,10 +144,10 @@ def register_action_callbacks(app: Dash, data_manager, module_to_attr: Dict[str,
             server_url = FOUR_PLAYER_SERVER if len(agents) == 4 else FIVE_PLAYER_SERVER
             try:
                 ensure_server_ready(server_url)
+                run_experiment_async(agents, server_url, exp_id)
             except PreflightError as exc:
                 return error(str(exc))
 
-            run_experiment_async(agents, server_url, exp_id)
             return success(f"Running experiment {exp_id} with {len(agents)} agents...")
         except Exception as e:
             logger.exception("Error preparing to run experiment")
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
-import json
+import hashlib
 from datetime import datetime
 from typing import List
 
-from dash import Dash
-from dash.dependencies import Input, Output
+import orjson
+from dash import Dash, no_update
+from dash.dependencies import ClientsideFunction, Input, Output, State
 
+from dashboard.components import format_timestamp
 from dashboard.config.ids import (
     EXPERIMENT_DROPDOWN,
     EXPERIMENTS_DATA,
+    EXPERIMENTS_VERSION,
     LAST_UPDATED,
     INTERVAL,
     EXPERIMENT_INFO,
@@ -18,42 +21,57 @@ from dashboard.config.ids import (
 
 def register_experiment_callbacks(app: Dash, data_manager):
     @app.callback(
-        [Output(EXPERIMENT_DROPDOWN, 'options'), Output(EXPERIMENTS_DATA, 'children'), Output(LAST_UPDATED, 'children')],
+        [
+            Output(EXPERIMENT_DROPDOWN, 'options'),
+            Output(EXPERIMENTS_DATA, 'data'),
+            Output(LAST_UPDATED, 'children'),
+            Output(EXPERIMENTS_VERSION, 'data'),
+        ],
         Input(INTERVAL, 'n_intervals'),
+        State(EXPERIMENTS_VERSION, 'data'),
         prevent_initial_call=False,
     )
-    def update_experiments_list(n_intervals):  # noqa: F401
-        experiments = data_manager.fetch_experiments(force_refresh=True)
+    def update_experiments_list(n_intervals, client_state):  # noqa: F401
+        timestamp = f"Last updated: {datetime.now().strftime('%H:%M:%S')}"
+        client_state = client_state or {}
+        # Only resend the list when this browser's copy is out of date
+        version = data_manager.fetch_experiments_version()
+        if version is not None and version == client_state.get('version'):
+            return no_update, no_update, timestamp, no_update
+
+        # Browsers catching up to the same version share one list query
+        if version is None:
+            experiments = data_manager.fetch_experiments(force_refresh=True)
+        else:
+            experiments = data_manager.fetch_experiments(version=version)
+        if not experiments and version and version[0]:
+            # The fetch failed; don't pin this version to an empty list
+            version = None
+
+        # The version also moves for games outside any experiment, so compare
+        # what the browser would actually see before resending it
+        # A content hash (not hash(), which is salted per process) so the digest a
+        # browser holds still matches after a dashboard restart
+        digest = hashlib.blake2b(orjson.dumps([
+            (exp['value'], exp['label'], exp['total_games'], exp['configured_agents'])
+            for exp in experiments
+        ]), digest_size=16).hexdigest()
+        new_state = {'version': version, 'digest': digest}
+        if digest == client_state.get('digest'):
+            return no_update, no_update, timestamp, new_state
         dropdown_options = [{'label': exp['label'], 'value': exp['value']} for exp in experiments]
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        return dropdown_options, json.dumps(experiments), f"Last updated: {timestamp}"
+        # Keyed by value (as a string, since JSON object keys are strings) for O(1)
+        # lookup; the display date is formatted here so the browser can render as-is
+        experiments_by_id = {
+            str(exp['value']): {**exp, 'created_display': format_timestamp(exp['created_at'])}
+            for exp in experiments
+        }
+        return dropdown_options, experiments_by_id, timestamp, new_state
 
-    @app.callback(
+    # Rendering the selected experiment only needs data already in the browser
+    # (figgie.renderExperimentInfo lives in assets/clientside.js)
+    app.clientside_callback(
+        ClientsideFunction(namespace='figgie', function_name='renderExperimentInfo'),
         Output(EXPERIMENT_INFO, 'children'),
-        [Input(EXPERIMENT_DROPDOWN, 'value'), Input(EXPERIMENTS_DATA, 'children')],
+        [Input(EXPERIMENT_DROPDOWN, 'value'), Input(EXPERIMENTS_DATA, 'data')],
     )
-    def update_experiment_info(selected_experiment, experiments_json):  # noqa: F401
-        if not selected_experiment or not experiments_json:
-            return ""
-        try:
-            experiments = json.loads(experiments_json)
-            experiment = next((exp for exp in experiments if exp['value'] == selected_experiment), None)
-            if not experiment:
-                return ""
-            from dashboard.components import format_timestamp
-            from dash import html
-            return html.Div([
-                html.H4(experiment['name']),
-                html.P(experiment['description'] or "No description"),
-                html.Div([
-                    html.Span(f"Games: {experiment['total_games']}", className="stat"),
-                    html.Span(f"Agents: {experiment['configured_agents']}", className="stat"),
-                ], className="experiment-stats"),
-                html.Small(f"Created: {format_timestamp(experiment['created_at'])}"),
-            ])
-        except Exception:
-            import logging
-            logging.getLogger(__name__).exception("Failed to render experiment info")
-            return ""
-
-
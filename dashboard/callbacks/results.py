@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
+import hashlib
 from typing import List
 
-import pandas as pd
-from dash import Dash
-from dash.dependencies import Input, Output
+import orjson
+from dash import Dash, no_update
+from dash.dependencies import Input, Output, State
 
 from dashboard.config.ids import (
     EXPERIMENT_DROPDOWN,
@@ -13,35 +13,66 @@ from dashboard.config.ids import (
     RESULTS_TABLE,
     METRICS_DATA,
     PROFIT_CHART,
+    PROFIT_CHART_KEY,
 )
-from dashboard.components.charts import empty_centered_message, profit_box_plot
+from dashboard.components.charts import empty_centered_message, profit_box_plot, profit_box_plot_patch
+
+# Static placeholder figures, validated once at import and never mutated
+_EMPTY_SELECT_FIG = empty_centered_message("Select an experiment to view results")
+_EMPTY_NO_DATA_FIG = empty_centered_message("No data available for this experiment")
 
 
 def register_results_callbacks(app: Dash, data_manager):
     @app.callback(
-        [Output(RESULTS_TABLE, 'data'), Output(METRICS_DATA, 'children'), Output(PROFIT_CHART, 'figure')],
+        [
+            Output(RESULTS_TABLE, 'data'),
+            Output(METRICS_DATA, 'children'),
+            Output(PROFIT_CHART, 'figure'),
+            Output(PROFIT_CHART_KEY, 'data'),
+        ],
         [Input(EXPERIMENT_DROPDOWN, 'value'), Input(INTERVAL, 'n_intervals')],
+        State(PROFIT_CHART_KEY, 'data'),
     )
-    def update_metrics_and_charts(selected_experiment, n_intervals):  # noqa: F401
+    def update_metrics_and_charts(selected_experiment, n_intervals, chart_key):  # noqa: F401
         if not selected_experiment:
-            empty_fig = empty_centered_message("Select an experiment to view results")
-            return [], "", empty_fig
-
-        df = data_manager.fetch_metrics(selected_experiment)
-        if df.empty:
-            empty_fig = empty_centered_message("No data available for this experiment")
-            return [], "", empty_fig
+            return [], "", _EMPTY_SELECT_FIG, None
 
-        profit_df = data_manager.fetch_individual_profits(selected_experiment)
-        profit_fig = profit_box_plot(profit_df)
+        records = data_manager.fetch_metrics_records(selected_experiment)
+        if not records:
+            return [], "", _EMPTY_NO_DATA_FIG, None
 
-        # Minimal sanitization for DataTable/JSON
-        if 'avg_profit' in df.columns:
-            df['avg_profit'] = pd.to_numeric(df['avg_profit'], errors='coerce')
-        df = df.where(pd.notna(df), None)
+        # The key describes what this browser is showing, so an interval tick
+        # only sends what changed: for the chart that is nothing, patched
+        # traces, or a new figure; the table is resent only when its numbers move.
+        state = chart_key or {}
+        same_experiment = state.get('experiment') == selected_experiment
 
-        records = df.to_dict('records')
-
-        return records, json.dumps(records), profit_fig
+        profit_df = data_manager.fetch_individual_profits(selected_experiment)
+        if profit_df.empty:
+            fig_key = None
+        else:
+            fig_key = {
+                'agents': profit_df['agent_name'].unique().tolist(),
+                'rows': len(profit_df),
+            }
+        prev_fig_key = state.get('figure') if same_experiment else None
+        if fig_key is not None and fig_key == prev_fig_key:
+            profit_fig = no_update
+        elif fig_key is not None and prev_fig_key and prev_fig_key.get('agents') == fig_key['agents']:
+            profit_fig = profit_box_plot_patch(profit_df)
+        else:
+            profit_fig = profit_box_plot(profit_df)
 
+        # Agent config columns are fixed per experiment; only the aggregates move
+        # blake2b rather than hash(), which is salted per process, so the digest
+        # survives a dashboard restart
+        metrics_digest = hashlib.blake2b(orjson.dumps(
+            [(row['num_games'], row['avg_profit']) for row in records]
+        ), digest_size=16).hexdigest()
+        new_state = {'experiment': selected_experiment, 'metrics': metrics_digest, 'figure': fig_key}
+        if same_experiment and metrics_digest == state.get('metrics'):
+            if new_state == state:
+                return no_update, no_update, profit_fig, no_update
+            return no_update, no_update, profit_fig, new_state
 
+        return records, orjson.dumps(records).decode(), profit_fig, new_state
@@ -1,11 +1,12 @@
 # Re-exports for convenience
-from .charts import empty_centered_message, profit_box_plot
+from .charts import empty_centered_message, profit_box_plot, profit_box_plot_patch
 from .messages import success, error, error_list
 from .utils import format_timestamp
 
 __all__ = [
     "empty_centered_message",
     "profit_box_plot",
+    "profit_box_plot_patch",
     "success",
     "error",
     "error_list",
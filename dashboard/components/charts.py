@@ -3,6 +3,7 @@ from typing import Any
 import plotly.express as px
 import plotly.graph_objects as go
 import pandas as pd
+from dash import Patch
 
 
 def empty_centered_message(message: str) -> go.Figure:
@@ -17,9 +18,12 @@ def empty_centered_message(message: str) -> go.Figure:
     return fig
 
 
+_EMPTY_BOX_PLOT_FIG = empty_centered_message("No individual game data available for box plot")
+
+
 def profit_box_plot(profit_df: pd.DataFrame) -> go.Figure:
     if profit_df.empty:
-        return empty_centered_message("No individual game data available for box plot")
+        return _EMPTY_BOX_PLOT_FIG
     fig = px.box(
         profit_df,
         x="agent_name",
@@ -33,3 +37,16 @@ def profit_box_plot(profit_df: pd.DataFrame) -> go.Figure:
     return fig
 
 
+def profit_box_plot_patch(profit_df: pd.DataFrame) -> Patch:
+    """Patch the traces of an existing profit_box_plot with new rows.
+
+    Only valid when the agents (and their order) match the rendered figure,
+    since px.box emits one trace per agent in order of appearance.
+    """
+    patch = Patch()
+    for i, (agent, group) in enumerate(profit_df.groupby("agent_name", sort=False)):
+        patch["data"][i]["x"] = [agent] * len(group)
+        patch["data"][i]["y"] = group["profit"].tolist()
+    return patch
+
+
@@ -1,39 +1,47 @@
+from itertools import count
+
 from dash import html
-import datetime
+
+
+# Icons are identical in every message, so build them once and share them
+_SUCCESS_ICON = html.I(className="fas fa-check-circle", style={'marginRight': '8px'})
+_ERROR_ICON = html.I(className="fas fa-exclamation-circle", style={'marginRight': '8px'})
+_LIST_ITEM_ICON = html.I(className="fas fa-times", style={'marginRight': '6px', 'fontSize': '0.8em'})
+
+# React keys only need to differ between renders so each popup remounts
+_msg_seq = count()
 
 
 def success(message: str):
     return html.Div([
         html.Div([
-            html.I(className="fas fa-check-circle", style={'marginRight': '8px'}),
+            _SUCCESS_ICON,
             html.Span(message)
         ], className="message-content")
-    ], className="message-popup message-success message-auto-hide", key=f"msg-success-{datetime.datetime.now().timestamp()}")
+    ], className="message-popup message-success message-auto-hide", key=f"msg-success-{next(_msg_seq)}")
 
 
 def error(message: str):
     return html.Div([
         html.Div([
-            html.I(className="fas fa-exclamation-circle", style={'marginRight': '8px'}),
+            _ERROR_ICON,
             html.Span(message)
         ], className="message-content")
-    ], className="message-popup message-error message-auto-hide", key=f"msg-error-{datetime.datetime.now().timestamp()}")
+    ], className="message-popup message-error message-auto-hide", key=f"msg-error-{next(_msg_seq)}")
 
 
 def error_list(title: str, items: list[str]):
     return html.Div([
         html.Div([
             html.Div([
-                html.I(className="fas fa-exclamation-circle", style={'marginRight': '8px'}),
+                _ERROR_ICON,
                 html.Span(title)
             ], className="message-popup-header"),
             html.Ul([
                 html.Li([
-                    html.I(className="fas fa-times", style={'marginRight': '6px', 'fontSize': '0.8em'}),
+                    _LIST_ITEM_ICON,
                     html.Span(item)
                 ]) for item in items
             ], className="message-popup-list")
         ], className="message-content")
-    ], className="message-popup message-error-list", key=f"msg-error-list-{datetime.datetime.now().timestamp()}")
-
-
+    ], className="message-popup message-error-list", key=f"msg-error-list-{next(_msg_seq)}")
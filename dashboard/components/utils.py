@@ -1,8 +1,13 @@
 from datetime import datetime
+from functools import lru_cache
 import logging
 
+@lru_cache(maxsize=1024)
 def format_timestamp(timestamp_str: str) -> str:
-    """Format ISO timestamp string to human-readable format"""
+    """Format ISO timestamp string to human-readable format
+
+    Memoized: created_at values are immutable, so every refresh repeats them.
+    """
     if not timestamp_str:
         return "Unknown"
     try:
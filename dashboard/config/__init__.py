@@ -6,7 +6,12 @@ from .settings import (
     REFRESH_INTERVAL,
     MAX_PLAYERS,
     EXPERIMENTS_CACHE_TTL,
-
+    EXPERIMENTS_VERSION_TTL,
+    METRICS_CACHE_MAX_ENTRIES,
+    PREFLIGHT_CACHE_TTL,
+    PREFLIGHT_ERROR_CACHE_TTL,
+    RUNNER_MAX_WORKERS,
+    RUNNER_MAX_PENDING,
 )
 
 # Intentionally do not wildcard-export ids/specs to keep explicit imports in callers
@@ -19,7 +24,12 @@ __all__ = [
     "REFRESH_INTERVAL",
     "MAX_PLAYERS",
     "EXPERIMENTS_CACHE_TTL",
-
+    "EXPERIMENTS_VERSION_TTL",
+    "METRICS_CACHE_MAX_ENTRIES",
+    "PREFLIGHT_CACHE_TTL",
+    "PREFLIGHT_ERROR_CACHE_TTL",
+    "RUNNER_MAX_WORKERS",
+    "RUNNER_MAX_PENDING",
 ]
 
 
@@ -1,9 +1,14 @@
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, TypedDict, Union
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ParamSpec(TypedDict, total=False):
     name: str
@@ -21,7 +26,7 @@ class AgentSpec(TypedDict):
 
 
 # Internal dataclass models with validation
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ParamSpecDC:
     name: str
     type: str = "text"
@@ -54,7 +59,7 @@ class ParamSpecDC:
         return data
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentSpecDC:
     label: str
     module: str
@@ -86,22 +91,53 @@ class AgentSpecDC:
         }
 
 
+_YAML_PATH = (Path(__file__).resolve().parent / ".." / ".." / "agents" / "traders.yaml").resolve()
+
+# Coercion per declared param type; types not listed (e.g. "text") pass through
+_COERCERS = {"int": int, "float": float, "bool": bool}
+
+# (name, coerce, min, max, default, is_numeric) per param
+_CompiledParam = Tuple[str, Optional[Callable[[Any], Any]], Optional[float], Optional[float], Any, bool]
+
+# The last parse and the (yaml path, mtime) it was read at; an edited file is
+# re-read and replaces it, so only the current version is ever kept. The last
+# element holds each spec's compiled params keyed by id(spec), with the spec
+# kept alongside so the id can't be reused while the entry lives.
+_SPECS_CACHE: Optional[Tuple[
+    Tuple[str, float],
+    List[AgentSpec],
+    Dict[str, str],
+    Dict[int, Tuple[AgentSpec, Tuple[_CompiledParam, ...]]],
+]] = None
+
+
 def load_agent_specs() -> Tuple[List[AgentSpec], Dict[str, str]]:
     """Load and validate agent specs from agents/traders.yaml.
 
+    Results are cached until the file's mtime changes. Each call gets its own
+    list and dict, but the spec dicts inside are shared and must not be mutated.
+
     Returns:
         - specs: list of {label, module, attr, params}
         - module_to_attr: mapping module->attr
     """
-    current_dir = Path(__file__).resolve().parent
-    yaml_path = (current_dir / ".." / ".." / "agents" / "traders.yaml").resolve()
+    global _SPECS_CACHE
+    yaml_path = _YAML_PATH
+
+    try:
+        cache_key: Optional[Tuple[str, float]] = (str(yaml_path), yaml_path.stat().st_mtime)
+    except OSError:
+        cache_key = None
+    cached = _SPECS_CACHE
+    if cached is not None and cache_key is not None and cached[0] == cache_key:
+        return list(cached[1]), dict(cached[2])
 
     specs: List[AgentSpec] = []
     module_to_attr: Dict[str, str] = {}
 
     try:
         with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f) or []
+            data = yaml.load(f.read(), Loader=_SafeLoader) or []
         for entry in data:
             try:
                 dc = AgentSpecDC.from_yaml_entry(entry or {})
@@ -112,23 +148,74 @@ def load_agent_specs() -> Tuple[List[AgentSpec], Dict[str, str]]:
             module_to_attr[dc.module] = dc.attr
     except Exception:
         logging.getLogger(__name__).exception("Failed loading traders.yaml")
+    else:
+        if cache_key is not None:
+            compiled = {id(spec): (spec, _build_compiled(spec)) for spec in specs}
+            _SPECS_CACHE = (cache_key, specs, module_to_attr, compiled)
+            return list(specs), dict(module_to_attr)
 
     return specs, module_to_attr
 
 
-def get_params_for_module(specs: List[AgentSpec], module_name: str) -> List[ParamSpec]:
-    # Build a temporary index for faster lookups when called frequently
-    index = {spec.get("module"): spec.get("params", []) for spec in specs}
-    return index.get(module_name, [])
+def index_specs_by_module(specs: List[AgentSpec]) -> Dict[str, AgentSpec]:
+    """Build the module->spec lookup once; pass it to the getters below."""
+    return {spec["module"]: spec for spec in specs}
+
+
+def get_params_for_module(
+    specs: Union[List[AgentSpec], Mapping[str, AgentSpec]], module_name: str
+) -> List[ParamSpec]:
+    """Params of the spec for module_name, or [] if there is none.
 
+    Accepts the spec list from load_agent_specs() or, for repeated lookups,
+    the index from index_specs_by_module().
+    """
+    spec = get_spec_by_module(specs, module_name)
+    return spec.get("params", []) if spec is not None else []
+
+
+def get_spec_by_module(
+    specs: Union[List[AgentSpec], Mapping[str, AgentSpec]], module_name: str
+) -> Optional[AgentSpec]:
+    """The spec for module_name, or None.
 
-def get_spec_by_module(specs: List[AgentSpec], module_name: str) -> Optional[AgentSpec]:
+    Accepts the spec list from load_agent_specs() (scanned) or the index from
+    index_specs_by_module() (a dict lookup).
+    """
+    if isinstance(specs, Mapping):
+        return specs.get(module_name)
     for spec in specs:
         if spec.get("module") == module_name:
             return spec
     return None
 
 
+def _compile_spec(spec: AgentSpec) -> Tuple[_CompiledParam, ...]:
+    # Specs from the current load_agent_specs() parse were compiled with it;
+    # any other spec dict is compiled on the spot
+    loaded = _SPECS_CACHE
+    if loaded is not None:
+        cached = loaded[3].get(id(spec))
+        if cached is not None and cached[0] is spec:
+            return cached[1]
+    return _build_compiled(spec)
+
+
+def _build_compiled(spec: AgentSpec) -> Tuple[_CompiledParam, ...]:
+    return tuple(
+        (
+            p["name"],
+            _COERCERS.get(p.get("type", "text")),
+            p.get("min"),
+            p.get("max"),
+            p.get("default"),
+            p.get("type", "text") in ("int", "float"),
+        )
+        for p in spec.get("params", [])
+        if p.get("name")
+    )
+
+
 def validate_params(extra_kwargs: Dict[str, Any], spec: AgentSpec) -> Tuple[Dict[str, Any], List[str]]:
     """Validate and coerce extra_kwargs according to the provided spec.
 
@@ -136,27 +223,15 @@ def validate_params(extra_kwargs: Dict[str, Any], spec: AgentSpec) -> Tuple[Dict
     """
     errors: List[str] = []
     coerced: Dict[str, Any] = {}
-    params = spec.get("params", [])
-    for p in params:
-        name = p.get("name")
-        if not name:
-            continue
-        ptype = p.get("type", "text")
-        pmin = p.get("min")
-        pmax = p.get("max")
-        default = p.get("default")
+    for name, coerce, pmin, pmax, default, is_numeric in _compile_spec(spec):
         value = extra_kwargs.get(name, default)
-        try:
-            if ptype == "int" and value is not None:
-                value = int(value)
-            elif ptype == "float" and value is not None:
-                value = float(value)
-            elif ptype == "bool" and value is not None:
-                value = bool(value)
-        except (TypeError, ValueError):
-            errors.append(f"Parameter '{name}' has invalid type")
-            continue
-        if ptype in ("int", "float") and (pmin is not None or pmax is not None) and value is None:
+        if coerce is not None and value is not None:
+            try:
+                value = coerce(value)
+            except (TypeError, ValueError):
+                errors.append(f"Parameter '{name}' has invalid type")
+                continue
+        if is_numeric and (pmin is not None or pmax is not None) and value is None:
             errors.append(f"Parameter '{name}' is required and must be a number")
             continue
         try:
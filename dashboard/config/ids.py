@@ -6,12 +6,14 @@ from typing import Dict
 # Static IDs
 EXPERIMENT_DROPDOWN = "experiment-dropdown"
 EXPERIMENTS_DATA = "experiments-data"
+EXPERIMENTS_VERSION = "experiments-version"
 LAST_UPDATED = "last-updated"
 EXPERIMENT_INFO = "experiment-info"
 
 RESULTS_TABLE = "results-table"
 METRICS_DATA = "metrics-data"
 PROFIT_CHART = "profit-chart"
+PROFIT_CHART_KEY = "profit-chart-key"
 
 RUN_BUTTON = "run-button"
 RUN_OUTPUT = "run-output"
@@ -12,6 +12,12 @@ REFRESH_INTERVAL = 5000  # milliseconds
 # Dashboard behavior
 MAX_PLAYERS = 5
 EXPERIMENTS_CACHE_TTL = 5  # seconds
+EXPERIMENTS_VERSION_TTL = 1  # seconds; shared by all open browsers
+METRICS_CACHE_MAX_ENTRIES = 32  # experiments whose results stay cached
+PREFLIGHT_CACHE_TTL = 2.0  # seconds
+PREFLIGHT_ERROR_CACHE_TTL = 0.5  # seconds
+RUNNER_MAX_WORKERS = 2
+RUNNER_MAX_PENDING = 4  # running + queued games before new runs are refused
 
 
 
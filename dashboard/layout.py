@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import List
 from dash import dcc, html, dash_table
 
 from .config import REFRESH_INTERVAL, MIN_POLLING_RATE, MAX_PLAYERS, DEFAULT_POLLING_RATE
@@ -6,9 +6,11 @@ from .config.ids import (
     EXPERIMENT_DROPDOWN,
     EXPERIMENT_INFO,
     EXPERIMENTS_DATA,
+    EXPERIMENTS_VERSION,
     METRICS_DATA,
     RESULTS_TABLE,
     PROFIT_CHART,
+    PROFIT_CHART_KEY,
     RUN_BUTTON,
     RUN_OUTPUT,
     SAVE_BUTTON,
@@ -27,11 +29,14 @@ from .config.ids import (
 )
 from .config.agent_specs import AgentSpec
 
+# (index, block, module, polling rate, params container) ids per agent slot
+_AGENT_BLOCK_IDS = tuple(
+    (i, agent_block_id(i), agent_module_id(i), agent_polling_rate_id(i), agent_params_container_id(i))
+    for i in range(1, MAX_PLAYERS + 1)
+)
+
 
-def build_app_layout(
-    agent_specs: List[AgentSpec],
-    fetch_experiments_initial: List[Dict[str, Any]],
-) -> html.Div:
+def build_app_layout(agent_specs: List[AgentSpec]) -> html.Div:
     traders_options = [{'label': s.get('label'), 'value': s.get('module')} for s in (agent_specs or [])]
     default_module = traders_options[0]['value'] if traders_options else None
     return html.Div([
@@ -51,7 +56,8 @@ def build_app_layout(
                     html.H3("Select Experiment", className="section-title"),
                     dcc.Dropdown(
                         id=EXPERIMENT_DROPDOWN,
-                        options=[{'label': exp['label'], 'value': exp['value']} for exp in fetch_experiments_initial],
+                        # Populated by update_experiments_list on page load
+                        options=[],
                         value=None,
                         placeholder='Select experiment to view or run',
                         clearable=False,
@@ -150,7 +156,7 @@ def build_app_layout(
                                             html.Div([
                                                 html.Label("Agent Type"),
                                                 dcc.Dropdown(
-                                                    id=agent_module_id(i),
+                                                    id=module_id,
                                                     options=traders_options,
                                                     value=default_module,
                                                     clearable=False,
@@ -160,7 +166,7 @@ def build_app_layout(
                                             html.Div([
                                                 html.Label("Polling Rate"),
                                                 dcc.Input(
-                                                    id=agent_polling_rate_id(i),
+                                                    id=polling_id,
                                                     type='number',
                                                     value=DEFAULT_POLLING_RATE,
                                                     step=0.01,
@@ -170,11 +176,11 @@ def build_app_layout(
                                             ], className="agent-config-section"),
                                         ], className="agent-config-row"),
                                         html.Div([
-                                            html.Div(id=agent_params_container_id(i), className="agent-params-container"),
+                                            html.Div(id=params_id, className="agent-params-container"),
                                         ], className="agent-config-section"),
                                     ], className="agent-config"),
-                                ], id=agent_block_id(i), className="agent-block", style={'display': 'block' if i <= 4 else 'none'})
-                                for i in range(1, MAX_PLAYERS + 1)
+                                ], id=block_id, className="agent-block", style={'display': 'block' if i <= 4 else 'none'})
+                                for i, block_id, module_id, polling_id, params_id in _AGENT_BLOCK_IDS
                             ],
                         ),
                     ], className="form-group"),
@@ -188,10 +194,12 @@ def build_app_layout(
             ], className="right-panel"),
         ], className="main-container"),
 
-        html.Div(id=EXPERIMENTS_DATA, style={'display': 'none'}),
         html.Div(id=METRICS_DATA, style={'display': 'none'}),
         dcc.Interval(id=INTERVAL, interval=REFRESH_INTERVAL, n_intervals=0, disabled=False),
         dcc.Store(id=EXPERIMENT_STORE),
+        dcc.Store(id=EXPERIMENTS_DATA),
+        dcc.Store(id=EXPERIMENTS_VERSION),
+        dcc.Store(id=PROFIT_CHART_KEY),
     ])
 
 
@@ -1,5 +1,5 @@
 from .experiments import create_experiment, get_experiment_agents
-from .metrics import list_experiments, fetch_metrics_df, fetch_individual_profits_df, fetch_results_bundle
+from .metrics import list_experiments, fetch_experiments_version, fetch_metrics_df, fetch_individual_profits_df, fetch_results_bundle
 from .runner import build_agent_configs, ensure_server_ready, run_experiment_async, PreflightError
 from .data import DataService
 
@@ -7,6 +7,7 @@ __all__ = [
     "create_experiment",
     "get_experiment_agents",
     "list_experiments",
+    "fetch_experiments_version",
     "fetch_metrics_df",
     "fetch_individual_profits_df",
     "fetch_results_bundle",
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def ttl_cache(seconds: float) -> Callable[[F], F]:
+    """Process-wide single-entry cache: reuse the last result for `seconds`.
+
+    Callers arriving while a refresh is in flight wait for it instead of
+    issuing their own, so there is at most one call per TTL window.
+    Exceptions are not cached. `cache_clear()` drops the stored result.
+    """
+    def decorator(func: F) -> F:
+        lock = threading.Lock()
+        # (args, value, monotonic timestamp)
+        entry: Optional[Tuple[Tuple[Any, ...], Any, float]] = None
+
+        @functools.wraps(func)
+        def wrapper(*args: Any) -> Any:
+            nonlocal entry
+            with lock:
+                now = time.monotonic()
+                if entry is not None and entry[0] == args and now - entry[2] < seconds:
+                    return entry[1]
+                value = func(*args)
+                entry = (args, value, now)
+                return value
+
+        def cache_clear() -> None:
+            nonlocal entry
+            with lock:
+                entry = None
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -1,87 +1,133 @@
 import logging
-import json
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
-from figgie_server.db import get_connection
-from ..config.settings import EXPERIMENTS_CACHE_TTL
-from .queries import (
-    FETCH_EXPERIMENT_STATS_SQL,
-    FETCH_AGENT_STATS_SQL,
-    FETCH_INDIVIDUAL_PROFITS_SQL,
-)
+from ..config.settings import EXPERIMENTS_CACHE_TTL, EXPERIMENTS_VERSION_TTL, METRICS_CACHE_MAX_ENTRIES
 from .metrics import (
     list_experiments as svc_list_experiments,
-    fetch_metrics_df as svc_fetch_metrics_df,
-    fetch_individual_profits_df as svc_fetch_individual_profits_df,
+    fetch_experiments_version as svc_fetch_experiments_version,
     fetch_results_bundle as svc_fetch_results_bundle,
 )
+from .cache import ttl_cache
+
+def _list_experiments_at(version: Optional[Tuple[Any, ...]] = None) -> List[Dict[str, Any]]:
+    # `version` only keys the cache entry: a new fingerprint is always a miss
+    return svc_list_experiments()
+
+
+# Shared by every DataService in the process, so concurrent callers reuse one fetch
+_cached_list_experiments = ttl_cache(EXPERIMENTS_CACHE_TTL)(_list_experiments_at)
 
 class DataService:
     """Manages data fetching and caching for the dashboard"""
 
     def __init__(self) -> None:
         self._logger = logging.getLogger(__name__)
-        self._experiments_cache: Optional[List[Dict[str, Any]]] = None
-        self._last_experiments_update: float = 0
-        self._cache_ttl: int = EXPERIMENTS_CACHE_TTL
-        self._metrics_cache: Dict[int, Dict[str, Any]] = {}
-
-    def fetch_experiments(self, force_refresh: bool = False) -> List[Dict[str, Any]]:
-        current_time = time.time()
-        if (
-            not force_refresh
-            and self._experiments_cache is not None
-            and current_time - self._last_experiments_update < self._cache_ttl
-        ):
-            return self._experiments_cache
+        # Ordered by last refresh and capped, so browsing many experiments can't grow it forever
+        self._metrics_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._version_cache: Optional[List[Any]] = None
+        self._last_version_check: float = 0
+        # Single-flight refreshes: on a cache miss one thread queries while the
+        # others wait on the lock and then read what it cached
+        self._version_lock = threading.Lock()
+        self._results_locks: Dict[int, threading.Lock] = {}
+        self._results_locks_guard = threading.Lock()
+
+    def fetch_experiments(
+        self, force_refresh: bool = False, version: Optional[List[Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Return experiment summaries.
 
+        Pass the fingerprint from fetch_experiments_version() to reuse a list
+        already fetched at that version (e.g. by another browser's tick).
+        """
+        if force_refresh:
+            _cached_list_experiments.cache_clear()
         try:
-            experiments = svc_list_experiments()
-            self._experiments_cache = experiments
-            self._last_experiments_update = current_time
-            return experiments
+            return _cached_list_experiments(tuple(version) if version is not None else None)
         except Exception:
             self._logger.exception("Error fetching experiments")
             return []
 
-    def fetch_metrics(self, experiment_id: int) -> pd.DataFrame:
-        try:
+    def fetch_experiments_version(self) -> Optional[List[Any]]:
+        """Return the experiments change fingerprint, or None if it can't be read.
+
+        Every open browser polls this on each interval tick, so the probe result
+        is shared for a short TTL instead of hitting the database per tick.
+        """
+        if self._version_fresh():
+            return self._version_cache
+        with self._version_lock:
+            if self._version_fresh():
+                return self._version_cache
+            try:
+                version = svc_fetch_experiments_version()
+                self._version_cache = version
+                self._last_version_check = time.time()
+                return version
+            except Exception:
+                self._logger.exception("Error fetching experiments version")
+                return None
+
+    def _version_fresh(self) -> bool:
+        return (
+            self._version_cache is not None
+            and time.time() - self._last_version_check < EXPERIMENTS_VERSION_TTL
+        )
+
+    def _results(self, experiment_id: int) -> Dict[str, Any]:
+        """Return the cached (metrics, profits) entry, refreshing it when stale.
+
+        The cached frames are handed to callers as-is and must be treated as
+        read-only; derive new frames (astype/where/to_dict) instead of mutating.
+        """
+        cached = self._metrics_cache.get(experiment_id)
+        if cached and (time.time() - cached.get("ts", 0) < 2):
+            return cached
+        with self._results_locks_guard:
+            lock = self._results_locks.setdefault(experiment_id, threading.Lock())
+        with lock:
             cached = self._metrics_cache.get(experiment_id)
             if cached and (time.time() - cached.get("ts", 0) < 2):
-                df = cached["metrics"].copy()
-            else:
-                df, profits = svc_fetch_results_bundle(experiment_id)
-                self._metrics_cache[experiment_id] = {"metrics": df.copy(), "profits": profits.copy(), "ts": time.time()}
-            # Ensure DataTable-friendly types
+                return cached
+            df, profits = svc_fetch_results_bundle(experiment_id)
+            # extra_kwargs arrives as text (see FETCH_AGENT_STATS_SQL)
             if not df.empty and "extra_kwargs" in df.columns:
-                def _to_str(val: Any) -> str:
-                    if isinstance(val, (dict, list)):
-                        try:
-                            return json.dumps(val)
-                        except Exception:
-                            return str(val)
-                    if val is None:
-                        return ""
-                    return str(val)
-                df["extra_kwargs"] = df["extra_kwargs"].apply(_to_str)
-
-            return df
+                df["extra_kwargs"] = df["extra_kwargs"].fillna("")
+            # DataTable rows are built once per refresh rather than per callback;
+            # numeric columns are floats already, so only NaN -> None is needed
+            records = df.astype(object).where(df.notna(), None).to_dict("records")
+            cached = {"metrics": df, "records": records, "profits": profits, "ts": time.time()}
+            with self._results_locks_guard:
+                self._metrics_cache[experiment_id] = cached
+                self._metrics_cache.move_to_end(experiment_id)
+                while len(self._metrics_cache) > METRICS_CACHE_MAX_ENTRIES:
+                    evicted, _ = self._metrics_cache.popitem(last=False)
+                    self._results_locks.pop(evicted, None)
+            return cached
+
+    def fetch_metrics(self, experiment_id: int) -> pd.DataFrame:
+        try:
+            return self._results(experiment_id)["metrics"]
         except Exception:
             self._logger.exception("Error fetching metrics for experiment_id=%s", experiment_id)
             return pd.DataFrame()
 
+    def fetch_metrics_records(self, experiment_id: int) -> List[Dict[str, Any]]:
+        """Metrics rows ready for the DataTable (JSON-safe, shared; don't mutate)."""
+        try:
+            return self._results(experiment_id)["records"]
+        except Exception:
+            self._logger.exception("Error fetching metrics for experiment_id=%s", experiment_id)
+            return []
+
     def fetch_individual_profits(self, experiment_id: int) -> pd.DataFrame:
         try:
-            cached = self._metrics_cache.get(experiment_id)
-            if cached and (time.time() - cached.get("ts", 0) < 2):
-                return cached["profits"].copy()
-            # If not cached, fetch both to populate cache
-            df_metrics, df_profits = svc_fetch_results_bundle(experiment_id)
-            self._metrics_cache[experiment_id] = {"metrics": df_metrics.copy(), "profits": df_profits.copy(), "ts": time.time()}
-            return df_profits
+            return self._results(experiment_id)["profits"]
         except Exception:
             self._logger.exception("Error fetching individual profits for experiment_id=%s", experiment_id)
             return pd.DataFrame()
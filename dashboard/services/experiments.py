@@ -1,10 +1,17 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Tuple
 
-from figgie_server.db import get_connection
+import orjson
+from psycopg.types.json import Jsonb
+
+from figgie_server.db import pooled_connection
+from .queries import (
+    FETCH_EXPERIMENT_AGENTS_SQL,
+    INSERT_EXPERIMENT_AGENT_SQL,
+    INSERT_EXPERIMENT_SQL,
+)
 
 
 def create_experiment(
@@ -16,39 +23,31 @@ def create_experiment(
 
     validated_agents: list of tuples (module_name, attr_name, polling_rate, extra_kwargs)
     """
-    conn = get_connection()
-    with conn.cursor() as cursor:
+    # One transaction per save; both statements run as prepared plans on the
+    # pooled connection (executemany always prepares its statement)
+    with pooled_connection() as conn, conn.cursor() as cursor:
         cursor.execute(
-            """
-            INSERT INTO experiments
-            (name, description, created_at)
-            VALUES (%s, %s, %s)
-            RETURNING experiment_id
-            """,
+            INSERT_EXPERIMENT_SQL,
             (name, description, datetime.now(timezone.utc)),
+            prepare=True,
         )
         exp_id = cursor.fetchone()[0]
-        for i, (module, cls_name, pr, extra_kwargs) in enumerate(validated_agents):
-            cursor.execute(
-                """
-                INSERT INTO experiment_agents
-                (experiment_id, player_index, module_name, attr_name, polling_rate, extra_kwargs)
-                VALUES (%s, %s, %s, %s, %s, %s)
-                """,
-                (exp_id, i, module, cls_name, pr, json.dumps(extra_kwargs)),
-            )
-    conn.commit()
+        # psycopg pipelines executemany, so all agent rows go out in one round trip;
+        # orjson's bytes output is sent as-is by the Jsonb dumper
+        cursor.executemany(
+            INSERT_EXPERIMENT_AGENT_SQL,
+            [
+                (exp_id, i, module, cls_name, pr, Jsonb(extra_kwargs, dumps=orjson.dumps))
+                for i, (module, cls_name, pr, extra_kwargs) in enumerate(validated_agents)
+            ],
+        )
     return exp_id
 
 
 def get_experiment_agents(experiment_id: int) -> List[Tuple[str, str, float, Any]]:
     """Return (module_name, attr_name, polling_rate, extra_kwargs) rows for an experiment."""
-    conn = get_connection()
-    with conn.cursor() as cur:
-        cur.execute(
-            'SELECT module_name, attr_name, polling_rate, extra_kwargs FROM experiment_agents WHERE experiment_id = %s ORDER BY player_index;',
-            (experiment_id,),
-        )
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(FETCH_EXPERIMENT_AGENTS_SQL, (experiment_id,), prepare=True)
         rows = cur.fetchall()
     return rows
 
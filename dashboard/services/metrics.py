@@ -1,77 +1,173 @@
 from __future__ import annotations
 
+import itertools
 import json
 from typing import Any, Dict, List, Tuple
 
 import pandas as pd
+from psycopg.rows import dict_row
 
-from figgie_server.db import get_connection
+from figgie_server.db import pooled_connection
 from dashboard.services.queries import (
     FETCH_EXPERIMENT_STATS_SQL,
+    FETCH_EXPERIMENTS_VERSION_SQL,
     FETCH_AGENT_STATS_SQL,
     FETCH_INDIVIDUAL_PROFITS_SQL,
+    FETCH_RESULTS_BUNDLE_SQL,
 )
 
+# Rows pulled per round trip when streaming a server-side cursor
+STREAM_ITERSIZE = 10000
+
+_cursor_ids = itertools.count()
+
+# Postgres type OIDs mapped to the numpy dtype their column should get
+_FLOAT_OIDS = frozenset({700, 701, 1700})  # float4, float8, numeric
+_INT_OIDS = frozenset({20, 21, 23})  # int8, int2, int4
+
+
+# Per query text: (column names, float columns, int columns). The SQL is a
+# module constant, so its result layout never changes between calls.
+_COLUMN_PLANS: Dict[str, Tuple[List[str], List[str], List[str]]] = {}
+
+
+def _column_plan(sql: str, description) -> Tuple[List[str], List[str], List[str]]:
+    plan = _COLUMN_PLANS.get(sql)
+    if plan is None:
+        plan = (
+            [d.name for d in description],
+            [d.name for d in description if d.type_code in _FLOAT_OIDS],
+            [d.name for d in description if d.type_code in _INT_OIDS],
+        )
+        _COLUMN_PLANS[sql] = plan
+    return plan
+
+
+def _apply_types(sql: str, df: pd.DataFrame, description) -> pd.DataFrame:
+    _, float_cols, int_cols = _column_plan(sql, description)
+    dtypes: Dict[str, str] = dict.fromkeys(float_cols, "float64")
+    for name in int_cols:
+        if not df[name].isna().any():
+            dtypes[name] = "int64"
+    return df.astype(dtypes) if dtypes else df
+
+
+def _typed_df(sql: str, records, description) -> pd.DataFrame:
+    """Build a DataFrame whose numeric columns follow the result's declared types.
+
+    Inference alone leaves all-NULL or mixed columns as object; integer columns
+    that do contain NULLs are left to inference rather than forced to float.
+    """
+    cols = _column_plan(sql, description)[0]
+    return _apply_types(sql, pd.DataFrame.from_records(records, columns=cols), description)
+
+
+def _stream_df(conn, sql: str, params: Tuple[Any, ...]) -> pd.DataFrame:
+    """Build a DataFrame from a named server-side cursor, one batch at a time.
+
+    Each fetchmany() batch becomes a small frame straight away, so at most one
+    batch of row tuples is alive at once instead of the whole result set.
+    """
+    with conn.cursor(name=f"stream_{next(_cursor_ids)}") as cur:
+        cur.itersize = STREAM_ITERSIZE
+        cur.execute(sql, params)
+        cols = _column_plan(sql, cur.description)[0]
+        frames = [
+            pd.DataFrame.from_records(batch, columns=cols)
+            for batch in iter(lambda: cur.fetchmany(STREAM_ITERSIZE), [])
+        ]
+        if not frames:
+            return _typed_df(sql, [], cur.description)
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        # A batch where a column is all NULL comes back as object; re-infer so
+        # the result matches what a single from_records() call would produce
+        return _apply_types(sql, df.infer_objects() if len(frames) > 1 else df, cur.description)
+
+
+def _with_agent_names(df: pd.DataFrame) -> pd.DataFrame:
+    """Add agent_name ("<attr_name><seat>") without concatenating per row.
+
+    A seat keeps one name for every row, so names are built once per distinct
+    player_index and then looked up for each row.
+    """
+    if df.empty:
+        # Nothing to look up; an empty copy keeps the text column's dtype
+        df["agent_name"] = df["attr_name"]
+        return df
+    seats = df.drop_duplicates("player_index")[["player_index", "attr_name"]]
+    names = seats["attr_name"] + (seats["player_index"] + 1).astype(str)
+    df["agent_name"] = df["player_index"].map(pd.Series(names.array, index=seats["player_index"].array))
+    return df
+
 
 def list_experiments() -> List[Dict[str, Any]]:
     """Return experiment summaries for the dropdown and info panel."""
-    conn = get_connection()
-    with conn.cursor() as cur:
-        cur.execute(FETCH_EXPERIMENT_STATS_SQL)
+    with pooled_connection() as conn, conn.cursor(row_factory=dict_row) as cur:
+        cur.execute(FETCH_EXPERIMENT_STATS_SQL, prepare=True)
         rows = cur.fetchall()
 
-    experiments: List[Dict[str, Any]] = []
-    for row in rows:
-        exp_id, name, description, created_at, total_games, configured_agents = row
-        experiments.append(
-            {
-                "label": f"{exp_id}: {name} ({total_games} games, {configured_agents} agents)",
-                "value": exp_id,
-                "name": name,
-                "description": description,
-                "created_at": created_at.isoformat() if created_at else None,
-                "total_games": total_games or 0,
-                "configured_agents": configured_agents or 0,
-            }
-        )
-    return experiments
+    return [
+        {
+            "label": f"{row['experiment_id']}: {row['name']} "
+                     f"({row['total_games'] or 0} games, {row['configured_agents'] or 0} agents)",
+            "value": row["experiment_id"],
+            "name": row["name"],
+            "description": row["description"],
+            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+            "total_games": row["total_games"] or 0,
+            "configured_agents": row["configured_agents"] or 0,
+        }
+        for row in rows
+    ]
+
+
+def fetch_experiments_version() -> List[Any]:
+    """Return a small JSON-safe fingerprint that changes whenever list_experiments would."""
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(FETCH_EXPERIMENTS_VERSION_SQL, prepare=True)
+        num_experiments, last_created, num_results = cur.fetchone()
+    return [num_experiments, last_created.isoformat() if last_created else None, num_results]
 
 
 def fetch_metrics_df(experiment_id: int) -> pd.DataFrame:
-    conn = get_connection()
-    with conn.cursor() as cur:
-        cur.execute(FETCH_AGENT_STATS_SQL, (experiment_id,))
-        rows = cur.fetchall()
-        cols = [d[0] for d in cur.description]
-        df = pd.DataFrame(rows, columns=cols)
-    return df
+    with pooled_connection() as conn, conn.cursor() as cur:
+        cur.execute(FETCH_AGENT_STATS_SQL, {"experiment_id": experiment_id}, prepare=True)
+        df = _typed_df(FETCH_AGENT_STATS_SQL, cur.fetchall(), cur.description)
+    return _with_agent_names(df)[_METRICS_COLUMNS]
 
 
 def fetch_individual_profits_df(experiment_id: int) -> pd.DataFrame:
-    conn = get_connection()
-    with conn.cursor() as cur:
-        cur.execute(FETCH_INDIVIDUAL_PROFITS_SQL, (experiment_id,))
-        rows = cur.fetchall()
-        cols = [d[0] for d in cur.description]
-        df = pd.DataFrame(rows, columns=cols)
-    return df
+    with pooled_connection() as conn:
+        df = _stream_df(conn, FETCH_INDIVIDUAL_PROFITS_SQL, (experiment_id,))
+    return _with_agent_names(df)[_PROFITS_COLUMNS].astype(_PROFITS_DTYPES)
+
+
+_METRICS_COLUMNS = [
+    "experiment_id", "player_index", "attr_name", "extra_kwargs",
+    "normalized_polling_rate", "agent_name", "num_games", "avg_profit",
+]
+_PROFITS_COLUMNS = ["agent_name", "attr_name", "player_index", "profit"]
+# Profit rows grow with every game, so keep them at their SQL widths
+# (smallint seat, int4 balance difference) rather than int64
+_PROFITS_DTYPES = {"player_index": "int8", "profit": "int32"}
 
 
 def fetch_results_bundle(experiment_id: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
-    """Fetch both metrics and individual profits in one connection for efficiency."""
-    conn = get_connection()
-    with conn.cursor() as cur:
-        # Metrics
-        cur.execute(FETCH_AGENT_STATS_SQL, (experiment_id,))
-        rows = cur.fetchall()
-        cols = [d[0] for d in cur.description]
-        metrics_df = pd.DataFrame(rows, columns=cols)
-
-        # Profits
-        cur.execute(FETCH_INDIVIDUAL_PROFITS_SQL, (experiment_id,))
-        rows2 = cur.fetchall()
-        cols2 = [d[0] for d in cur.description]
-        profits_df = pd.DataFrame(rows2, columns=cols2)
-    return metrics_df, profits_df
+    """Fetch metrics and individual profits with one streamed query.
 
+    The experiment's results are joined once and both the per-agent aggregates
+    and the per-game rows come back in the same result set (see
+    FETCH_RESULTS_BUNDLE_SQL), split here on the `kind` column.
+    """
+    with pooled_connection() as conn:
+        # Profits grow with every round played, so stream them
+        df = _stream_df(conn, FETCH_RESULTS_BUNDLE_SQL, {"experiment_id": experiment_id})
 
+    df = _with_agent_names(df)
+    is_agg = df["kind"] == "agg"
+    # Columns that are NULL in the other half come back as object; restore them
+    metrics_df = df.loc[is_agg, _METRICS_COLUMNS].reset_index(drop=True).astype(
+        {"experiment_id": "int64", "num_games": "int64"}
+    )
+    profits_df = df.loc[~is_agg, _PROFITS_COLUMNS].reset_index(drop=True).astype(_PROFITS_DTYPES)
+    return metrics_df, profits_df
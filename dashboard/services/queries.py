@@ -1,50 +1,101 @@
+# Results are aggregated per (agent config, round duration) before joining to
+# experiment_agents, so the polling-rate match runs on a handful of groups
+# instead of every result row.
 FETCH_AGENT_STATS_SQL = """
+    WITH agg AS (
+        SELECT
+            a.attr_name,
+            a.extra_kwargs::text AS extra_kwargs,
+            a.polling_rate,
+            rnd.round_duration,
+            COUNT(*) AS num_games,
+            SUM(r.final_balance - r.initial_balance) AS total_profit
+        FROM agents a
+        JOIN results r ON r.player_id = a.player_id
+        JOIN rounds rnd ON rnd.round_id = r.round_id
+        WHERE a.experiment_id = %(experiment_id)s
+        GROUP BY a.attr_name, a.extra_kwargs::text, a.polling_rate, rnd.round_duration
+    )
     SELECT
     ea.experiment_id,
     ea.player_index,
     ea.attr_name,
-    ea.extra_kwargs,
+    COALESCE(ea.extra_kwargs::text, '') AS extra_kwargs,
     ea.polling_rate AS normalized_polling_rate,
-    ea.attr_name || (ea.player_index + 1)::text AS agent_name,
-    COUNT(*) FILTER (
-        WHERE ABS(a2.polling_rate - (ea.polling_rate * rnd.round_duration / 240.0)) < 0.001
-    ) AS num_games,
-    AVG((r2.final_balance - r2.initial_balance)) FILTER (
-        WHERE ABS(a2.polling_rate - (ea.polling_rate * rnd.round_duration / 240.0)) < 0.001
-    ) AS avg_profit
+    COALESCE(SUM(agg.num_games), 0)::int8 AS num_games,
+    (SUM(agg.total_profit) / NULLIF(SUM(agg.num_games), 0))::float8 AS avg_profit
     FROM experiment_agents ea
-    LEFT JOIN agents a2
-    ON a2.experiment_id = ea.experiment_id
-    AND a2.attr_name = ea.attr_name
-    AND a2.extra_kwargs::text = ea.extra_kwargs::text
-    LEFT JOIN results r2
-    ON r2.player_id = a2.player_id
-    LEFT JOIN rounds rnd
-    ON rnd.round_id = r2.round_id
-    WHERE ea.experiment_id = %s
+    LEFT JOIN agg
+    ON agg.attr_name = ea.attr_name
+    AND agg.extra_kwargs = ea.extra_kwargs::text
+    AND ABS(agg.polling_rate - (ea.polling_rate * agg.round_duration / 240.0)) < 0.001
+    WHERE ea.experiment_id = %(experiment_id)s
     GROUP BY ea.experiment_id, ea.player_index, ea.attr_name, ea.extra_kwargs, ea.polling_rate
     ORDER BY ea.player_index;
 """
 
+# Each count is aggregated on its own before joining to experiments, rather
+# than COUNT(DISTINCT) over the experiment_agents x agents x results fan-out.
 FETCH_EXPERIMENT_STATS_SQL = """
-    SELECT 
+    SELECT
         e.experiment_id,
         e.name,
         e.description,
         e.created_at,
-        COUNT(DISTINCT r.round_id) as total_games,
-        COUNT(DISTINCT ea.player_index) as configured_agents
+        COALESCE(g.total_games, 0) AS total_games,
+        COALESCE(p.configured_agents, 0) AS configured_agents
     FROM experiments e
-    LEFT JOIN experiment_agents ea ON e.experiment_id = ea.experiment_id
-    LEFT JOIN agents a ON ea.experiment_id = a.experiment_id
-    LEFT JOIN results r ON a.player_id = r.player_id
-    GROUP BY e.experiment_id, e.name, e.description, e.created_at
+    LEFT JOIN (
+        -- (experiment_id, player_index) is the primary key, so no DISTINCT needed
+        SELECT experiment_id, COUNT(*) AS configured_agents
+        FROM experiment_agents
+        GROUP BY experiment_id
+    ) p ON p.experiment_id = e.experiment_id
+    LEFT JOIN (
+        SELECT experiment_id, COUNT(*) AS total_games
+        FROM (
+            SELECT DISTINCT a.experiment_id, r.round_id
+            FROM agents a
+            JOIN results r ON r.player_id = a.player_id
+        ) played
+        GROUP BY experiment_id
+    ) g ON g.experiment_id = e.experiment_id
+    -- games only count for experiments that have configured agents
+    AND p.experiment_id IS NOT NULL
     ORDER BY e.created_at DESC;
 """
 
+# Cheap change probe for the experiments list: new experiments bump the
+# count/created_at, finished games bump the results count (total_games).
+FETCH_EXPERIMENTS_VERSION_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM experiments),
+        (SELECT MAX(created_at) FROM experiments),
+        (SELECT COUNT(*) FROM results);
+"""
+
+INSERT_EXPERIMENT_SQL = """
+    INSERT INTO experiments
+    (name, description, created_at)
+    VALUES (%s, %s, %s)
+    RETURNING experiment_id;
+"""
+
+INSERT_EXPERIMENT_AGENT_SQL = """
+    INSERT INTO experiment_agents
+    (experiment_id, player_index, module_name, attr_name, polling_rate, extra_kwargs)
+    VALUES (%s, %s, %s, %s, %s, %s);
+"""
+
+FETCH_EXPERIMENT_AGENTS_SQL = """
+    SELECT module_name, attr_name, polling_rate, extra_kwargs
+    FROM experiment_agents
+    WHERE experiment_id = %s
+    ORDER BY player_index;
+"""
+
 FETCH_INDIVIDUAL_PROFITS_SQL = """
     SELECT
-        ea.attr_name || (ea.player_index + 1) AS agent_name,
         ea.attr_name,
         ea.player_index,
         r.final_balance - r.initial_balance AS profit
@@ -60,3 +111,52 @@ FETCH_INDIVIDUAL_PROFITS_SQL = """
 """
 
 
+# Both halves of fetch_results_bundle from one pass over the experiment's
+# matched results: one 'agg' row per configured agent (same columns as
+# FETCH_AGENT_STATS_SQL) followed by one 'profit' row per game played
+# (the FETCH_INDIVIDUAL_PROFITS_SQL columns), told apart by `kind`.
+# agent_name is not selected by any of these: it only depends on the seat, so
+# it is composed once per seat in Python (see metrics._with_agent_names).
+FETCH_RESULTS_BUNDLE_SQL = """
+    WITH j AS (
+        SELECT
+            ea.experiment_id,
+            ea.player_index,
+            ea.attr_name,
+            ea.extra_kwargs,
+            ea.polling_rate,
+            r.round_id,
+            r.final_balance - r.initial_balance AS profit
+        FROM experiment_agents ea
+        LEFT JOIN (
+            agents a
+            JOIN results r ON r.player_id = a.player_id
+            JOIN rounds rnd ON rnd.round_id = r.round_id
+        )
+        ON a.experiment_id = ea.experiment_id
+        AND a.attr_name = ea.attr_name
+        AND a.extra_kwargs::text = ea.extra_kwargs::text
+        AND ABS(a.polling_rate - (ea.polling_rate * rnd.round_duration / 240.0)) < 0.001
+        WHERE ea.experiment_id = %(experiment_id)s
+    )
+    SELECT
+        'agg' AS kind,
+        experiment_id,
+        player_index,
+        attr_name,
+        COALESCE(extra_kwargs::text, '') AS extra_kwargs,
+        polling_rate AS normalized_polling_rate,
+        COUNT(profit)::int8 AS num_games,
+        AVG(profit)::float8 AS avg_profit,
+        NULL::int4 AS profit,
+        NULL::text AS round_id
+    FROM j
+    GROUP BY experiment_id, player_index, attr_name, extra_kwargs, polling_rate
+    UNION ALL
+    SELECT
+        'profit', NULL, player_index, attr_name, NULL, NULL,
+        NULL, NULL, profit, round_id
+    FROM j
+    WHERE round_id IS NOT NULL
+    ORDER BY kind, player_index, round_id;
+"""
@@ -1,34 +1,71 @@
 from __future__ import annotations
 
-import json
+import logging
+import queue
 import threading
-from typing import List, Tuple, Dict, Any
+import time
+from concurrent.futures import Future
+from typing import List, Tuple, Dict, Any, Optional
 
 from agents.dispatcher import preflight_check, run_game, AgentConfig
 from agents.dispatcher import ServerBusyError, ServerQueuePendingError, ServerStatusUnavailable
+from ..config.settings import (
+    PREFLIGHT_CACHE_TTL,
+    PREFLIGHT_ERROR_CACHE_TTL,
+    RUNNER_MAX_WORKERS,
+    RUNNER_MAX_PENDING,
+)
 
 
 class PreflightError(Exception):
     pass
 
 
+# server_url -> (checked_at, error message or None for a passing check)
+_preflight_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+
+# Games run on a small fixed pool of daemon threads, so stopping the dashboard
+# doesn't wait for running or queued games (ThreadPoolExecutor joins its workers
+# at exit); _pending counts running + queued jobs
+_jobs: "queue.SimpleQueue[Tuple[Future, Tuple[Any, ...]]]" = queue.SimpleQueue()
+_workers: List[threading.Thread] = []
+_pending = 0
+_pending_lock = threading.Lock()
+
+
+def _worker() -> None:
+    while True:
+        future, args = _jobs.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            result = run_game(*args)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+
+def _ensure_workers() -> None:
+    # Called with _pending_lock held
+    while len(_workers) < RUNNER_MAX_WORKERS:
+        t = threading.Thread(target=_worker, name=f"figgie-run-{len(_workers)}", daemon=True)
+        t.start()
+        _workers.append(t)
+
+
 def build_agent_configs(rows: List[Tuple[str, str, float, Any]]) -> List[AgentConfig]:
     agents: List[AgentConfig] = []
     for module_name, attr_name, pr, extra in rows:
-        if isinstance(extra, (str, bytes, bytearray)):
-            try:
-                kwargs = json.loads(extra)
-            except (ValueError, TypeError):
-                kwargs = {}
-        elif isinstance(extra, dict):
-            kwargs = extra.copy()
-        else:
-            kwargs = {}
-        agents.append(AgentConfig(module_name, attr_name, float(pr), kwargs))
+        # extra_kwargs is JSONB, so psycopg hands back a fresh dict per row;
+        # make_agent only reads it, so no defensive copy is needed
+        kwargs = extra or {}
+        # polling_rate is a REAL column, which psycopg already returns as float
+        agents.append(AgentConfig(module_name, attr_name, pr, kwargs))
     return agents
 
 
-def ensure_server_ready(server_url: str) -> None:
+def _check_server(server_url: str) -> None:
     try:
         preflight_check(server_url)
     except ServerBusyError as exc:
@@ -39,7 +76,56 @@ def ensure_server_ready(server_url: str) -> None:
         raise PreflightError(f"Could not reach server at {server_url}: {exc}") from exc
 
 
-def run_experiment_async(agents: List[AgentConfig], server_url: str, experiment_id: int) -> None:
-    threading.Thread(target=run_game, args=(agents, server_url, experiment_id), daemon=True).start()
+def ensure_server_ready(server_url: str) -> None:
+    """Raise PreflightError unless the server can accept a new game.
+
+    Results are cached briefly per URL so repeated clicks skip the HTTP
+    round trip; failures expire sooner so a freed server is picked up quickly.
+    """
+    now = time.monotonic()
+    cached = _preflight_cache.get(server_url)
+    if cached is not None:
+        checked_at, err = cached
+        ttl = PREFLIGHT_CACHE_TTL if err is None else PREFLIGHT_ERROR_CACHE_TTL
+        if now - checked_at < ttl:
+            if err is not None:
+                raise PreflightError(err)
+            return
+    try:
+        _check_server(server_url)
+    except PreflightError as exc:
+        _preflight_cache[server_url] = (now, str(exc))
+        raise
+    _preflight_cache[server_url] = (now, None)
+
+
+def _run_finished(future: Future) -> None:
+    global _pending
+    with _pending_lock:
+        _pending -= 1
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None:
+        logging.getLogger(__name__).error("Experiment run failed", exc_info=exc)
+
+
+def run_experiment_async(agents: List[AgentConfig], server_url: str, experiment_id: int) -> Future:
+    """Queue a game on the runner pool, raising PreflightError when it is full.
+
+    Returns the run's Future, which is done once the game has finished.
+    """
+    global _pending
+    with _pending_lock:
+        if _pending >= RUNNER_MAX_PENDING:
+            raise PreflightError("Too many experiments are already running. Please try again shortly.")
+        _pending += 1
+        _ensure_workers()
+    # The server is about to get busy, so a cached "ready" no longer holds
+    _preflight_cache.pop(server_url, None)
+    future: Future = Future()
+    future.add_done_callback(_run_finished)
+    _jobs.put((future, (agents, server_url, experiment_id)))
+    return future
 
 
@@ -2,6 +2,7 @@ import threading
 from flask import Flask, request, jsonify, current_app
 import os
 
+from figgie_server import db
 from figgie_server.game import NUM_PLAYERS
 
 app = Flask(__name__)
@@ -30,8 +31,12 @@ def state():
     pid = request.args.get("player_id")
     if not pid or pid not in current_app.game.players:
         return jsonify(error="Invalid or missing player_id"), 400
-    with lock:
-        resp = current_app.game.get_state(req_pid=pid)
+    # Polling reads the published snapshot without the lock; only a round
+    # whose time has run out needs the locked path, which ends it
+    resp = current_app.game.snapshot_state(req_pid=pid)
+    if resp is None:
+        with lock:
+            resp = current_app.game.get_state(req_pid=pid)
     return jsonify(resp), 200
 
 @app.route("/action", methods=["POST"])
@@ -71,4 +76,6 @@ def status():
         current_players=len(current_app.game.players),
         total_players=int(os.getenv("NUM_PLAYERS", "4")),
         trading_duration=int(os.getenv("TRADING_DURATION", str(4 * 60))),
+        # Whether results can be recorded; db.ping caches successes briefly
+        database=db.ping(),
         ), 200
\ No newline at end of file
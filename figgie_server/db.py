@@ -1,35 +1,104 @@
+import atexit
+import logging
 import os
+import queue
 import threading
-import json
-from datetime import datetime, timezone
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 import psycopg
+from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool
 
-# Ensure thread-safe DB access
-_db_lock = threading.Lock()
-
-# Singleton connection
-_conn = None
-
-def get_connection():
-    global _conn
-    if _conn is None:
-        host = os.getenv("POSTGRES_HOST", "localhost")
-        port = int(os.getenv("DB_PORT", "5432"))
-        dbname = os.getenv("POSTGRES_DB", "figgie")
-        user = os.getenv("POSTGRES_USER", "figgie")
-        password = os.getenv("POSTGRES_PASSWORD", "secret_password")
-        _conn = psycopg.connect(
-            host=host,
-            port=port,
-            dbname=dbname,
-            user=user,
-            password=password,
-        )
-    return _conn
+# Shared pool; every read and write borrows a connection from it, so
+# concurrent request threads and the event writer never queue on one lock
+_pool = None
+_pool_lock = threading.Lock()
+
+# Connection settings are read on first connect rather than at import, so
+# callers (and tests) can set the environment after importing this module
+def _connect_kwargs():
+    return {
+        "host": os.getenv("POSTGRES_HOST", "localhost"),
+        "port": int(os.getenv("DB_PORT", "5432")),
+        "dbname": os.getenv("POSTGRES_DB", "figgie"),
+        "user": os.getenv("POSTGRES_USER", "figgie"),
+        "password": os.getenv("POSTGRES_PASSWORD", "secret_password"),
+    }
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    kwargs=_connect_kwargs(),
+                    min_size=int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+                    max_size=int(os.getenv("DB_POOL_MAX_SIZE", "8")),
+                    # Give up on a checkout quickly when the database is down
+                    # instead of stalling callers for psycopg_pool's 30s default
+                    timeout=float(os.getenv("DB_POOL_TIMEOUT", "3")),
+                    open=True,
+                )
+    return _pool
+
+def pooled_connection():
+    """Borrow a pooled connection: `with pooled_connection() as conn: ...`
+
+    The transaction is committed on a clean exit, rolled back on error,
+    and the connection goes back to the pool either way.
+    """
+    return get_pool().connection()
+
+# A successful ping is trusted for this many seconds
+PING_CACHE_TTL = 1.0
+_last_ping_ok = None
+
+def ping(timeout: float = 0.5) -> bool:
+    """Return True if the database answers within `timeout` seconds.
+
+    Uses a pooled connection rather than opening a new one, and reuses a
+    success for PING_CACHE_TTL seconds so frequent liveness checks stay
+    cheap. Failures are not cached.
+    """
+    global _last_ping_ok
+    if _last_ping_ok is not None and time.monotonic() - _last_ping_ok < PING_CACHE_TTL:
+        return True
+    try:
+        with get_pool().connection(timeout=timeout) as conn:
+            conn.execute(
+                "SELECT set_config('statement_timeout', %s, true)",
+                (str(int(timeout * 1000)),),
+                prepare=True,
+            )
+            conn.execute("SELECT 1", prepare=True)
+    except psycopg.Error:
+        return False
+    _last_ping_ok = time.monotonic()
+    return True
+
+@contextmanager
+def _autocommit_connection():
+    """Borrow a pooled connection in autocommit mode for a single statement.
+
+    Saves the BEGIN and COMMIT round trips a transaction would add; the
+    connection is switched back before it returns to the pool.
+    """
+    with pooled_connection() as conn:
+        conn.autocommit = True
+        try:
+            yield conn
+        finally:
+            conn.autocommit = False
+
+# actions and trades are append-only event logs that nothing else depends on;
+# opting in creates them UNLOGGED (no WAL, emptied by crash recovery, not
+# replicated) for faster ingest
+UNLOGGED_EVENT_TABLES = os.getenv("DB_UNLOGGED_EVENT_TABLES", "0") == "1"
 
 def init_db():
-    conn = get_connection()
-    with _db_lock:
+    event_table = "UNLOGGED TABLE" if UNLOGGED_EVENT_TABLES else "TABLE"
+    with pooled_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS players(
@@ -49,8 +118,8 @@ def init_db():
                 end_time TIMESTAMP WITH TIME ZONE
             );
         ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS actions(
+        cursor.execute(f'''
+            CREATE {event_table} IF NOT EXISTS actions(
                 action_id SERIAL PRIMARY KEY,
                 round_id TEXT,
                 player_id TEXT,
@@ -63,8 +132,8 @@ def init_db():
                 timestamp TIMESTAMP WITH TIME ZONE
             );
         ''')
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS trades(
+        cursor.execute(f'''
+            CREATE {event_table} IF NOT EXISTS trades(
                 trade_id SERIAL PRIMARY KEY,
                 round_id TEXT,
                 buyer TEXT,
@@ -126,120 +195,269 @@ def init_db():
                 PRIMARY KEY (round_id, player_id)
             );
         ''')
-        conn.commit()
+        # Dashboard stats look up an experiment's agents by their config, then
+        # their results; both indexes carry the columns those joins read so
+        # they can be answered from the index alone
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS agents_experiment_config_idx
+            ON agents(experiment_id, attr_name, polling_rate) INCLUDE (player_id, extra_kwargs);
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS results_player_covering_idx
+            ON results(player_id) INCLUDE (round_id, initial_balance, final_balance);
+        ''')
+        # The primary key finds a round but doesn't carry round_duration, which
+        # the polling-rate match reads for every joined result
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS rounds_duration_covering_idx
+            ON rounds(round_id) INCLUDE (round_duration);
+        ''')
+        # Event logs are read back one round at a time, in time order
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS actions_round_time_idx ON actions(round_id, timestamp);
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS trades_round_time_idx ON trades(round_id, timestamp);
+        ''')
+
+# High-frequency event rows (players, orders, cancellations, trades) are queued
+# and written by a background thread in batches, one commit per batch, so the
+# game loop never waits on a commit. Round ends go through the same queue, as
+# an ordered call, so their results land after the round's events; agent rows
+# stay synchronous.
+_INSERT_PLAYER_SQL = '''
+    INSERT INTO players(player_id, name, joined_at)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (player_id) DO NOTHING'''
+
+# Orders, cancellations and trades are append-only, so they are streamed in
+# with binary COPY; (statement, column types) pairs
+_COPY_ACTIONS = (
+    '''COPY actions
+    (action_type, round_id, order_id, player_id, order_type, suit, price, time_remaining, timestamp)
+    FROM STDIN (FORMAT BINARY)''',
+    ("text", "text", "text", "text", "text", "text", "int4", "int4", "timestamptz"),
+)
+
+_COPY_TRADES = (
+    '''COPY trades
+    (round_id, buyer, seller, suit, price, time_remaining, timestamp)
+    FROM STDIN (FORMAT BINARY)''',
+    ("text", "text", "text", "text", "int4", "int4", "timestamptz"),
+)
+
+# Seconds the writer keeps collecting rows after the first one arrives
+WRITE_BATCH_INTERVAL = float(os.getenv("DB_WRITE_BATCH_INTERVAL", "0.05"))
+
+_write_queue = queue.SimpleQueue()
+_writer = None
+_writer_lock = threading.Lock()
+
+def _ensure_writer():
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_writer_loop, name="figgie-db-writer", daemon=True)
+                _writer.start()
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+def _enqueue(target, params: tuple):
+    """Queue one row; target is an INSERT statement or a _COPY_* pair.
+
+    Every queued row ends with its event time. Callers leave that slot out:
+    it is taken here as time.time_ns(), which is far cheaper than building a
+    datetime on the game thread, and converted by the writer.
+    """
+    _ensure_writer()
+    _write_queue.put((target, params, time.time_ns()))
+
+def _enqueue_call(fn, *args):
+    """Queue fn(*args) to run on the writer after every row queued before it."""
+    _ensure_writer()
+    _write_queue.put((fn, args, None))
+
+def _write_batch(batch):
+    # Queued calls are ordering barriers: rows queued before one are written
+    # first, and rows queued after it are written after it returns
+    rows = []
+    for item in batch:
+        if callable(item[0]):
+            if rows:
+                _write_rows(rows)
+                rows = []
+            fn, args, _ = item
+            try:
+                fn(*args)
+            except Exception:
+                logging.getLogger(__name__).exception("Failed running queued %s", fn.__name__)
+        else:
+            rows.append(item)
+    if rows:
+        _write_rows(rows)
+
+def _write_rows(batch):
+    # Group by target (dicts keep first-seen order, lists keep row order)
+    by_target = {}
+    for target, params, ts_ns in batch:
+        ts = _EPOCH + timedelta(microseconds=ts_ns // 1000)
+        by_target.setdefault(target, []).append((*params, ts))
+    logger = logging.getLogger(__name__)
+    try:
+        with pooled_connection() as conn, conn.cursor() as cursor:
+            for target, rows in by_target.items():
+                # Each target gets its own savepoint, so a bad row only
+                # loses the rows queued for the same table
+                try:
+                    with conn.transaction():
+                        if isinstance(target, str):
+                            cursor.executemany(target, rows)
+                            continue
+                        sql, types = target
+                        with cursor.copy(sql) as copy:
+                            copy.set_types(types)
+                            for row in rows:
+                                copy.write_row(row)
+                except Exception:
+                    logger.exception("Failed writing %d queued rows", len(rows))
+    except Exception:
+        logger.exception("Failed writing %d queued rows", len(batch))
+
+def _writer_loop():
+    while True:
+        batch = []
+        waiters = []
+        item = _write_queue.get()
+        deadline = time.monotonic() + WRITE_BATCH_INTERVAL
+        while True:
+            if item[0] is None:
+                waiters.append(item[1])
+            else:
+                batch.append(item)
+            remaining = deadline - time.monotonic()
+            if waiters or remaining <= 0:
+                break
+            try:
+                item = _write_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+        if batch:
+            _write_batch(batch)
+        for event in waiters:
+            event.set()
+
+def flush(timeout: float = None) -> bool:
+    """Block until every row queued before this call has been written."""
+    if _writer is None:
+        return True
+    done = threading.Event()
+    _write_queue.put((None, done))
+    return done.wait(timeout)
+
+atexit.register(flush, 5.0)
 
 def log_player(player_id: str, name: str):
-    conn = get_connection()
-    with _db_lock:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO players(player_id, name, joined_at) 
-            VALUES (%s, %s, %s) 
-            ON CONFLICT (player_id) DO NOTHING''',
-            (player_id, name, datetime.now(timezone.utc))
-        )
-        conn.commit()
+    _enqueue(_INSERT_PLAYER_SQL, (player_id, name))
+
+# round_id -> rounds row (without end_time) for rounds still in play; the
+# row is inserted whole by log_round_end, so a round costs one write
+_rounds_pending = {}
 
 def log_round_start(round_id: str, num_players: int, round_duration: int, goal_suit: str, small_suit: str):
-    conn = get_connection()
-    with _db_lock:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO rounds
-            (round_id, num_players, round_duration, goal_suit, small_suit, start_time)
-            VALUES (%s, %s, %s, %s, %s, %s) 
-            ON CONFLICT (round_id) DO NOTHING''',
-            (round_id, num_players, round_duration, goal_suit, small_suit, datetime.now(timezone.utc))
-        )
-        conn.commit()
+    _rounds_pending[round_id] = (
+        round_id, num_players, round_duration, goal_suit, small_suit, datetime.now(timezone.utc),
+    )
 
 def log_order(round_id: str, order, time_remaining: int):
-    conn = get_connection()
-    with _db_lock:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO actions
-            (action_type, round_id, order_id, player_id, order_type, suit, price, time_remaining, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)''',
-            ('order', round_id, order.order_id, order.player_id, order.type,
-             order.suit, order.price, time_remaining, datetime.now(timezone.utc))
-        )
-        conn.commit()
+    _enqueue(_COPY_ACTIONS, (
+        'order', round_id, order.order_id, order.player_id, order.type,
+        order.suit, order.price, time_remaining,
+    ))
 
 def log_cancellation(round_id: str, order, time_remaining: int):
-    conn = get_connection()
-    with _db_lock:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO actions
-            (action_type, round_id, order_id, player_id, order_type, suit, price, time_remaining, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)''',
-            ('cancellation', round_id, order.order_id, order.player_id, order.type,
-             order.suit, order.price, time_remaining, datetime.now(timezone.utc))
-        )
-        conn.commit()
+    _enqueue(_COPY_ACTIONS, (
+        'cancellation', round_id, order.order_id, order.player_id, order.type,
+        order.suit, order.price, time_remaining,
+    ))
 
 def log_trade(round_id: str, trade, time_remaining: int):
-    conn = get_connection()
-    with _db_lock:
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO trades
-            (round_id, buyer, seller, suit, price, time_remaining, timestamp)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)''',
-            (round_id, trade.buyer, trade.seller, trade.suit,
-             trade.price, time_remaining, datetime.now(timezone.utc))
-        )
-        conn.commit()
+    _enqueue(_COPY_TRADES, (
+        round_id, trade.buyer, trade.seller, trade.suit,
+        trade.price, time_remaining,
+    ))
+
+# Order of the per-suit columns in the results table
+_RESULT_SUITS = ('spades', 'clubs', 'hearts', 'diamonds')
 
 def log_round_end(round_id: str, results: dict, initial_balances: dict, final_balances: dict, initial_hands: dict, final_hands: dict):
-    conn = get_connection()
-    with _db_lock:
+    # Rows are built here, but written by the writer after the round's queued
+    # players, orders and trades, so ending a round never waits on the database
+    end_time = datetime.now(timezone.utc)
+    round_row = _rounds_pending.pop(round_id, None)
+    bonuses = results.get('bonuses', {})
+    winners = results.get('winners', [])
+    share_each = results.get('share_each', 0)
+    rows = []
+    for pid, init_bal in initial_balances.items():
+        init_hand = initial_hands.get(pid, {})
+        final_hand = final_hands.get(pid, {})
+        rows.append((
+            round_id, pid,
+            init_bal, final_balances.get(pid, 0),
+            *[init_hand.get(suit, 0) for suit in _RESULT_SUITS],
+            *[final_hand.get(suit, 0) for suit in _RESULT_SUITS],
+            bonuses.get(pid, 0),
+            pid in winners,
+            share_each
+        ))
+    _enqueue_call(_write_round_end, round_id, round_row, end_time, rows)
+
+def _write_round_end(round_id: str, round_row, end_time: datetime, rows: list):
+    # One pipeline: the rounds row and the results rows go out back to back and
+    # are synced once, instead of waiting on each statement in turn
+    with pooled_connection() as conn, conn.pipeline():
         cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE rounds SET end_time = %s WHERE round_id = %s''',
-            (datetime.now(timezone.utc), round_id)
-        )
-        for pid, init_bal in initial_balances.items():
-            final_bal = final_balances.get(pid, 0)
-            init_hand = initial_hands.get(pid, {})
-            final_hand = final_hands.get(pid, {})
+        if round_row is not None:
             cursor.execute('''
-                INSERT INTO results
-                (round_id, player_id,
-                 initial_balance, final_balance,
-                 initial_spades, initial_clubs, initial_hearts, initial_diamonds,
-                 final_spades, final_clubs, final_hearts, final_diamonds,
-                 bonus, is_winner, share_each)
-                    VALUES (%s, %s, %s, %s,
-                            %s, %s, %s, %s,
-                            %s, %s, %s, %s,
-                            %s, %s, %s)
-                ON CONFLICT (round_id, player_id) DO NOTHING''',
-                (
-                    round_id, pid,
-                    init_bal, final_bal,
-                    init_hand.get('spades', 0), init_hand.get('clubs', 0),
-                    init_hand.get('hearts', 0), init_hand.get('diamonds', 0),
-                    final_hand.get('spades', 0), final_hand.get('clubs', 0),
-                    final_hand.get('hearts', 0), final_hand.get('diamonds', 0),
-                    results.get('bonuses', {}).get(pid, 0),
-                    pid in results.get('winners', []),
-                    results.get('share_each', 0)
-                )
+                INSERT INTO rounds
+                (round_id, num_players, round_duration, goal_suit, small_suit, start_time, end_time)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (round_id) DO NOTHING''',
+                (*round_row, end_time),
+                prepare=True,
+            )
+        else:
+            # Round started before this process (e.g. a restart); just close it
+            cursor.execute('''
+                UPDATE rounds SET end_time = %s WHERE round_id = %s''',
+                (end_time, round_id),
+                prepare=True,
             )
-        conn.commit()
+        cursor.executemany('''
+            INSERT INTO results
+            (round_id, player_id,
+             initial_balance, final_balance,
+             initial_spades, initial_clubs, initial_hearts, initial_diamonds,
+             final_spades, final_clubs, final_hearts, final_diamonds,
+             bonus, is_winner, share_each)
+                VALUES (%s, %s, %s, %s,
+                        %s, %s, %s, %s,
+                        %s, %s, %s, %s,
+                        %s, %s, %s)
+            ON CONFLICT (round_id, player_id) DO NOTHING''',
+            rows
+        )
 
 def log_agent(player_id: str, module_name: str, attr_name: str, extra_kwargs: dict, polling_rate: float, experiment_id: int = 0):
-    conn = get_connection()
-    with _db_lock:
+    with _autocommit_connection() as conn:
         cursor = conn.cursor()
         cursor.execute('''
             INSERT INTO agents 
             (player_id, module_name, attr_name, extra_kwargs, polling_rate, experiment_id, created_at)
             VALUES (%s, %s, %s, %s, %s, %s, %s)
             ON CONFLICT (player_id) DO NOTHING''',
-            (player_id, module_name, attr_name, json.dumps(extra_kwargs), 
-             polling_rate, experiment_id, datetime.now(timezone.utc))
+            (player_id, module_name, attr_name, Jsonb(extra_kwargs),
+             polling_rate, experiment_id, datetime.now(timezone.utc)),
+            prepare=True,
         )
-        conn.commit()
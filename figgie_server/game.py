@@ -1,10 +1,10 @@
 import os
-import uuid
 import random
 import logging
-from datetime import datetime
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
 from figgie_server.models import Order, Trade, Player, Market
 from figgie_server import db
@@ -19,6 +19,8 @@ NUM_PLAYERS = int(os.getenv("NUM_PLAYERS", "4"))
 if NUM_PLAYERS not in (4, 5):
     raise RuntimeError("NUM_PLAYERS must be 4 or 5")
 TRADING_DURATION = int(os.getenv("TRADING_DURATION", str(4 * 60)))  # seconds
+# Remaining seconds -> the 0-240 scale clients see
+_TIME_LEFT_SCALE = 240 / TRADING_DURATION
 
 SUITS = ["spades", "clubs", "hearts", "diamonds"]
 SUIT_COLORS = {
@@ -27,9 +29,29 @@ SUIT_COLORS = {
     "hearts": "red",
     "diamonds": "red"
 }
+# The goal suit is the other suit of the same colour as the 12-card suit
+GOAL_BY_TWELVE = {
+    s: next(o for o in SUITS if o != s and SUIT_COLORS[o] == SUIT_COLORS[s])
+    for s in SUITS
+}
+
+# Ids are 32 random hex digits, like uuid4().hex, drawn from one urandom read per batch
+_ID_BATCH = 256
+_ID_BUF: deque = deque()
+
+def _new_id() -> str:
+    if not _ID_BUF:
+        raw = os.urandom(16 * _ID_BATCH)
+        _ID_BUF.extend(raw[i:i + 16].hex() for i in range(0, 16 * _ID_BATCH, 16))
+    return _ID_BUF.popleft()
+
+# A forked child must not hand out ids already buffered by its parent
+os.register_at_fork(after_in_child=_ID_BUF.clear)
 
 class Game:
-    def __init__(self) -> None:
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        # Source of wall-clock seconds for the round timer; tests may pass a fixed clock
+        self._clock = clock
         self.round_id = None
         self.reset()
         logger.info("Initialized new Game instance.")
@@ -41,16 +63,19 @@ class Game:
         """
         if self.state == "waiting" or self.state == "completed":
             return
-        now = datetime.now().timestamp()
-        elapsed = now - (self.start_time or now)
-        raw_time_left = max(0.0, TRADING_DURATION - elapsed)
+        raw_time_left = self._raw_time_left()
         if raw_time_left == 0.0:
             self.end_round()
-        return int(raw_time_left / TRADING_DURATION * 240)
+        return int(raw_time_left * _TIME_LEFT_SCALE)
+
+    def _raw_time_left(self) -> float:
+        now = self._clock()
+        elapsed = now - (self.start_time or now)
+        return max(0.0, TRADING_DURATION - elapsed)
 
     def get_game_status(self):
         self._compute_or_finalize_time()
-        now = datetime.now().timestamp()
+        now = self._clock()
         time_left = TRADING_DURATION - (now - (self.start_time or now)) if self.state == "trading" else 0
         return self.state, time_left
 
@@ -63,21 +88,24 @@ class Game:
         # Markets per suit
         self.markets: Dict[str, Market] = {s: Market() for s in SUITS}
         self.trades: List[Trade] = []                      # executed trades
+        self._trades_json: List[dict] = []                 # trades as rendered in get_state
         self.pot = 0
         self.start_time: Optional[float] = None
         self.suit_counts: Optional[Dict[str,int]] = None   # counts per suit
         self.goal_suit: Optional[str] = None
         self.results: Optional[dict] = None
         # generate a new round ID
-        self.round_id = uuid.uuid4().hex
+        self.round_id = _new_id()
+        self._publish()
         logger.info("Game state has been reset.")
 
     def add_player(self, name: str) -> str:
-        pid = uuid.uuid4().hex
+        pid = _new_id()
         self.players[pid] = Player(player_id=pid, name=name)
-        logger.info(f"Player added: {name} (ID: {pid})")
+        logger.info("Player added: %s (ID: %s)", name, pid)
         # log player join
         db.log_player(pid, name)
+        self._publish()
         return pid
 
     def can_start(self) -> bool:
@@ -89,9 +117,8 @@ class Game:
         self.suit_counts = dict(zip(SUITS, counts))
         twelve = next(s for s, c in self.suit_counts.items() if c == 12)
         eight  = next(s for s, c in self.suit_counts.items() if c == 8)
-        col12 = SUIT_COLORS[twelve]
-        self.goal_suit = next(s for s in SUITS if s != twelve and SUIT_COLORS[s] == col12)
-        logger.info(f"Suit counts: {self.suit_counts}, goal: {self.goal_suit}")
+        self.goal_suit = GOAL_BY_TWELVE[twelve]
+        logger.info("Suit counts: %s, goal: %s", self.suit_counts, self.goal_suit)
 
         # record initial money balances of players at start of round
         self.initial_balances = {pid: p.money for pid, p in self.players.items()}
@@ -102,7 +129,7 @@ class Game:
         for p in self.players.values():
             p.money -= ante
             p.hand = {s: 0 for s in SUITS}
-        logger.info(f"Pot initialized to ${self.pot}")
+        logger.info("Pot initialized to $%s", self.pot)
 
         # shuffle the deck
         deck: List[str] = []
@@ -121,7 +148,8 @@ class Game:
         self.initial_hands = {pid: p.hand.copy() for pid, p in self.players.items()}
 
         self.state = "trading"
-        self.start_time = datetime.now().timestamp()
+        self.start_time = self._clock()
+        self._publish()
         logger.info("Round state changed to 'trading'.")
 
         db.log_round_start(self.round_id, NUM_PLAYERS, TRADING_DURATION, self.goal_suit, eight)
@@ -130,7 +158,7 @@ class Game:
         if self.state == "completed":
             return
         self.state = "completed"
-        logger.info(f"Ending round. Goal suit: {self.goal_suit}")
+        logger.info("Ending round. Goal suit: %s", self.goal_suit)
         goal = self.goal_suit
         goal_suit_counts = {pid: p.hand.get(goal, 0) for pid, p in self.players.items()}
         total_bonus = 0
@@ -149,7 +177,7 @@ class Game:
             bonuses[pid] += share
         self.results = {"goal_suit": goal, "counts": goal_suit_counts, "bonuses": bonuses,
                         "winners": winners, "share_each": share}
-        logger.info(f"Results computed: {self.results}")
+        logger.info("Results computed: %s", self.results)
         # log round end with snapshots
         db.log_round_end(
             self.round_id,
@@ -160,6 +188,7 @@ class Game:
             {pid: p.hand.copy() for pid, p in self.players.items()}
         )
         self.pot = 0
+        self._publish()
         logger.info("Round state changed to 'completed'.")
 
     def match_order(self, pid: str, otype: str, suit: str, price: int) -> Tuple[bool, Optional[str], Optional[Order]]:
@@ -201,8 +230,7 @@ class Game:
 
         market = self.markets[suit]
         # cancel duplicate orders by same player for same suit and price
-        side_list = market.bids if otype == "buy" else market.offers
-        if any(o.player_id == pid and o.price == price for o in side_list):
+        if market.has_order(pid, otype, price):
             return None, "Duplicate order"
 
         valid_order, mid, match = self.match_order(pid, otype, suit, price)
@@ -218,6 +246,8 @@ class Game:
             self.players[seller].money += match.price
             tr = Trade(buyer=buyer, seller=seller, price=match.price, suit=suit)
             self.trades.append(tr)
+            tr_json = tr.as_dict()
+            self._trades_json.append(tr_json)
             # log trade in DB
             db.log_trade(self.round_id, tr, time_remaining)
             # clear all orders in all markets
@@ -225,33 +255,18 @@ class Game:
             for m in self.markets.values():
                 m.bids.clear()
                 m.offers.clear()
-            return {"trade": tr.__dict__}, None
+            self._publish()
+            return {"trade": tr_json}, None
 
         # no match: add to market
-        oid = uuid.uuid4().hex
+        oid = _new_id()
         new_o = Order(order_id=oid, player_id=pid, type=otype, suit=suit, price=price)
         self.orders[oid] = new_o
         # log order in DB
         db.log_order(self.round_id, new_o, time_remaining)
         # insert order in sorted position (stable for same price)
-        if otype == "buy":
-            # descending order
-            idx = 0
-            for idx, existing in enumerate(market.bids):
-                if existing.price < price:
-                    break
-            else:
-                idx = len(market.bids)
-            market.bids.insert(idx, new_o)
-        else:
-            # ascending order
-            idx = 0
-            for idx, existing in enumerate(market.offers):
-                if existing.price > price:
-                    break
-            else:
-                idx = len(market.offers)
-            market.offers.insert(idx, new_o)
+        market.add(new_o)
+        self._publish()
         return {"order_id": oid}, None
 
     def cancel_order(self, pid: str, otype: str, suit: str, price: int) -> Tuple[dict, Optional[str]]:
@@ -261,7 +276,7 @@ class Game:
         If passed price is -1, all orders will be canceled.
         If otype is 'both', applies to both buy and sell. If suit is 'all', applies to all suits.
         Only cancels orders owned by pid.
-        Returns a dict with canceled order IDs, or an error message.
+        Returns a dict with canceled order IDs, in the order they were placed, or an error message.
         """
         # validation
         if (time_remaining := self._compute_or_finalize_time()) == 0:
@@ -283,27 +298,19 @@ class Game:
                 continue
             # cancel logic: all orders if price == -1, else buy with price >= threshold, sell with price <= threshold
             if price == -1 or (o.type == 'buy' and o.price >= price) or (o.type == 'sell' and o.price <= price):
-                market = self.markets[o.suit]
-                if o.type == 'buy' and o in market.bids:
-                    market.bids.remove(o)
-                if o.type == 'sell' and o in market.offers:
-                    market.offers.remove(o)
+                self.markets[o.suit].remove(o)
                 canceled.append(oid)
                 # log cancellation in DB
                 db.log_cancellation(self.round_id, o, time_remaining)
                 del self.orders[oid]
+        if canceled:
+            self._publish()
         return {'canceled': canceled}, None
 
-    def get_state(self, req_pid: str) -> dict:
-        time_left = None
-        if self.state == "trading":
-            time_left = self._compute_or_finalize_time()
-
-        # Requester's current hand
-        requester_hand = self.players[req_pid].hand.copy()
-
-        # All trades so far
-        trades_list = [t.__dict__ for t in self.trades]
+    def _public_state(self) -> dict:
+        """The part of get_state that is the same for every player."""
+        # All trades so far; the rendered dicts are shared, only the list is copied
+        trades_list = self._trades_json.copy()
 
         # Market info: highest bid and lowest ask per suit
         market = {}
@@ -323,13 +330,52 @@ class Game:
 
         resp = {
             "state": self.state,
-            "time_left": time_left,
             "pot": self.pot,
-            "hand": requester_hand,
             "market": market,
             "balances": balances,
             "trades": trades_list
         }
         if self.state == "completed":
             resp["results"] = self.results
+        return resp
+
+    def _publish(self) -> None:
+        """
+        Rebuild the snapshot served by snapshot_state.
+        Called by every method that changes what get_state reports; the new
+        tuple replaces the old one in a single assignment, so readers never
+        see a half-built snapshot.
+        """
+        hands = {pid: p.hand.copy() for pid, p in self.players.items()}
+        self._snapshot = (self._public_state(), hands)
+
+    def snapshot_state(self, req_pid: str) -> Optional[dict]:
+        """
+        Lock-free read of the last published state for req_pid.
+        Returns None when the caller must fall back to get_state under the
+        game lock: the round's time is up (ending it is a write) or req_pid
+        is not in the snapshot yet. Nested values (hand, market, trades) are
+        shared with the snapshot, so the result must be treated as read-only.
+        """
+        public, hands = self._snapshot
+        hand = hands.get(req_pid)
+        if hand is None:
+            return None
+        time_left = None
+        if public["state"] == "trading":
+            raw_time_left = self._raw_time_left()
+            if raw_time_left == 0.0:
+                return None
+            time_left = int(raw_time_left * _TIME_LEFT_SCALE)
+        return {**public, "time_left": time_left, "hand": hand}
+
+    def get_state(self, req_pid: str) -> dict:
+        time_left = None
+        if self.state == "trading":
+            time_left = self._compute_or_finalize_time()
+
+        resp = self._public_state()
+        resp["time_left"] = time_left
+        # Requester's current hand
+        resp["hand"] = self.players[req_pid].hand.copy()
         return resp
\ No newline at end of file
@@ -1,7 +1,8 @@
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     order_id: str
     player_id: str
@@ -9,14 +10,17 @@ class Order:
     suit: str
     price: int
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     buyer: str
     seller: str
     price: int
     suit: str
 
-@dataclass
+    def as_dict(self) -> Dict[str, object]:
+        return {"buyer": self.buyer, "seller": self.seller, "price": self.price, "suit": self.suit}
+
+@dataclass(slots=True)
 class Player:
     player_id: str
     name: str
@@ -24,7 +28,47 @@ class Player:
     # before a round, hand is an empty dict; during/after round, hand maps suits to counts
     hand: Dict[str, int] = field(default_factory=dict)
 
-@dataclass
+def _bid_key(order: Order) -> int:
+    return -order.price
+
+def _offer_key(order: Order) -> int:
+    return order.price
+
+@dataclass(slots=True)
 class Market:
+    # Best price first; equal prices keep arrival order (time priority)
     bids: List[Order] = field(default_factory=list)
     offers: List[Order] = field(default_factory=list)
+
+    def add(self, order: Order) -> None:
+        """Insert a resting order at its price-time position (binary search)."""
+        if order.type == "buy":
+            insort(self.bids, order, key=_bid_key)
+        else:
+            insort(self.offers, order, key=_offer_key)
+
+    def has_order(self, player_id: str, otype: str, price: int) -> bool:
+        """Whether player_id already rests an order of this type at this price."""
+        side, key = (self.bids, _bid_key) if otype == "buy" else (self.offers, _offer_key)
+        target = -price if otype == "buy" else price
+        for i in range(bisect_left(side, target, key=key), len(side)):
+            existing = side[i]
+            if key(existing) != target:
+                break
+            if existing.player_id == player_id:
+                return True
+        return False
+
+    def remove(self, order: Order) -> bool:
+        """Remove this exact order if it is resting; returns whether it was."""
+        side, key = (self.bids, _bid_key) if order.type == "buy" else (self.offers, _offer_key)
+        target = key(order)
+        # Jump to the order's price level, then scan only that level
+        for i in range(bisect_left(side, target, key=key), len(side)):
+            existing = side[i]
+            if existing is order:
+                del side[i]
+                return True
+            if key(existing) != target:
+                break
+        return False
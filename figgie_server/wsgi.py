@@ -7,4 +7,4 @@ db.init_db()
 app.game = Game()
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=int(os.getenv("PORT", "5000")))
\ No newline at end of file
@@ -59,14 +59,17 @@ def test_postgres_database(docker_services, docker_ip):
     os.environ["POSTGRES_USER"] = "figgie"
     os.environ["POSTGRES_PASSWORD"] = "secret_password"
 
-    # Reset any existing singleton connection
-    db._conn = None
+    # Drop any pool opened before the environment above was set
+    if db._pool is not None:
+        db._pool.close()
+        db._pool = None
 
     # Initialize the database schema
     db.init_db()
 
     yield
 
-    # Tear-down: close the connection
-    conn = db.get_connection()
-    conn.close()
+    # Tear-down: land queued writes, then close the pool
+    db.flush(5.0)
+    db.get_pool().close()
+    db._pool = None
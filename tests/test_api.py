@@ -1,6 +1,10 @@
 import unittest
 import time
+from unittest.mock import patch
 
+import psycopg
+
+import figgie_server.db as db
 import figgie_server.game as game_mod
 import figgie_server.api as api_mod
 
@@ -99,3 +103,41 @@ class TestAppEndpoints(unittest.TestCase):
         self.assertEqual(data.get('state'), 'completed')
         self.assertIn('results', data)
 
+
+    def test_state_reflects_actions(self):
+        self._join_all_players()
+        pid = next(iter(self.game.players))
+        self.game.players[pid].money = 1000
+        before = self.client.get('/state', query_string={'player_id': pid}).get_json()
+        self.assertIsNone(before['market']['spades']['highest_bid'])
+        rv = self.client.post('/action', json={'player_id': pid, 'action_type': 'order', 'order_type': 'buy', 'suit': 'spades', 'price': 40})
+        self.assertEqual(rv.status_code, 200)
+        after = self.client.get('/state', query_string={'player_id': pid}).get_json()
+        self.assertEqual(after['market']['spades']['highest_bid'], {'player_id': pid, 'price': 40})
+        self.assertEqual(after, {**self.game.get_state(pid), 'time_left': after['time_left']})
+
+    def test_status_reports_database(self):
+        db._last_ping_ok = None
+        rv = self.client.get('/status')
+        self.assertEqual(rv.status_code, 200)
+        data = rv.get_json()
+        self.assertEqual(data['state'], 'waiting')
+        self.assertIs(data['database'], True)
+
+    def test_ping_caches_success_but_not_failure(self):
+        db._last_ping_ok = None
+        self.assertTrue(db.ping())
+        with patch.object(db, 'get_pool') as get_pool:
+            get_pool.return_value.connection.side_effect = psycopg.OperationalError("down")
+            # a recent success is reused without touching the pool
+            self.assertTrue(db.ping())
+            get_pool.assert_not_called()
+            # once it expires, the probe runs and the failure is reported ...
+            with patch.object(db, 'PING_CACHE_TTL', 0):
+                self.assertFalse(db.ping())
+                # ... and not cached, so the next call probes again
+                self.assertFalse(db.ping())
+            self.assertEqual(get_pool.call_count, 2)
+        db._last_ping_ok = None
+        rv = self.client.get('/status')
+        self.assertIs(rv.get_json()['database'], True)
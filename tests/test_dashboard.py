@@ -1,8 +1,11 @@
 from dashboard.app import data_manager, app
 from dashboard.components import format_timestamp
 from dashboard.services import DataService
-from dashboard.config.agent_specs import load_agent_specs, get_spec_by_module, validate_params
-from unittest.mock import patch, MagicMock
+from dashboard.services import runner
+from dashboard.services.cache import ttl_cache
+from dashboard.config.agent_specs import load_agent_specs, get_spec_by_module, index_specs_by_module, validate_params
+from unittest.mock import patch
+import threading
 import pandas as pd
 
 def test_data_manager():
@@ -53,6 +56,10 @@ def test_agent_specs_loading_and_validation():
     # if any spec exists, validate param coercion path is stable
     if specs:
         spec = specs[0]
+        # lookups accept the spec list or a prebuilt module index
+        assert get_spec_by_module(specs, spec["module"]) is spec
+        assert get_spec_by_module(index_specs_by_module(specs), spec["module"]) is spec
+        assert get_spec_by_module(specs, "no.such.module") is None
         coerced, errors = validate_params({}, spec)
         assert isinstance(coerced, dict)
         assert isinstance(errors, list)
@@ -65,17 +72,63 @@ def test_format_timestamp_graceful():
     # bad input returns original
     assert format_timestamp('not-a-date') == 'not-a-date'
 
-def test_data_manager_logs_on_errors(monkeypatch):
+def test_data_manager_logs_on_errors(caplog):
     dm = DataService()
-    fake_conn = MagicMock()
-    fake_cur = MagicMock()
-    fake_conn.cursor.return_value.__enter__.return_value = fake_cur
-    # force execute to raise
-    fake_cur.execute.side_effect = RuntimeError('boom')
-    with patch('dashboard.services.data.get_connection', return_value=fake_conn):
-        # these should swallow exceptions and return empty structures
+    # every read borrows a pooled connection; make borrowing fail
+    with patch('dashboard.services.metrics.pooled_connection', side_effect=RuntimeError('boom')), \
+            caplog.at_level('ERROR', logger='dashboard.services.data'):
+        # these should log and swallow exceptions and return empty structures
         assert dm.fetch_experiments(force_refresh=True) == []
-        assert isinstance(dm.fetch_metrics(1), pd.DataFrame)
+        assert dm.fetch_experiments_version() is None
         assert dm.fetch_metrics(1).empty
-        assert isinstance(dm.fetch_individual_profits(1), pd.DataFrame)
+        assert dm.fetch_metrics_records(1) == []
         assert dm.fetch_individual_profits(1).empty
+    messages = [r.getMessage() for r in caplog.records]
+    assert "Error fetching experiments" in messages
+    assert "Error fetching experiments version" in messages
+    assert "Error fetching metrics for experiment_id=1" in messages
+    assert "Error fetching individual profits for experiment_id=1" in messages
+    assert all(r.exc_info and str(r.exc_info[1]) == 'boom' for r in caplog.records)
+
+def test_ttl_cache_reuses_result_until_cleared():
+    calls = []
+
+    @ttl_cache(60)
+    def load():
+        calls.append(1)
+        return len(calls)
+
+    assert load() == 1
+    assert load() == 1
+    load.cache_clear()
+    assert load() == 2
+
+def test_run_experiment_async_runs_on_daemon_workers():
+    def fake_run_game(agents, server_url, experiment_id):
+        if experiment_id < 0:
+            raise RuntimeError('bad run')
+        return experiment_id
+
+    with patch.object(runner, 'run_game', fake_run_game):
+        ok = runner.run_experiment_async([], 'http://u', 7)
+        failed = runner.run_experiment_async([], 'http://u', -1)
+        assert ok.result(timeout=5) == 7
+        assert isinstance(failed.exception(timeout=5), RuntimeError)
+    # workers must not keep the dashboard process alive at exit
+    assert runner._workers and all(t.daemon for t in runner._workers)
+
+def test_cancelled_run_is_released_quietly(caplog):
+    release = threading.Event()
+    with patch.object(runner, 'run_game', lambda *args: release.wait(5)):
+        # occupy every worker so the next run stays queued
+        busy = [runner.run_experiment_async([], 'http://u', i) for i in range(runner.RUNNER_MAX_WORKERS)]
+        queued = runner.run_experiment_async([], 'http://u', 99)
+        pending = runner._pending
+        with caplog.at_level('ERROR'):
+            assert queued.cancel()
+        assert runner._pending == pending - 1
+        assert not caplog.records
+        release.set()
+        for f in busy:
+            f.result(timeout=5)
+
@@ -0,0 +1,57 @@
+import threading
+import time
+import unittest
+
+from figgie_server import db
+
+
+class TestEventWriter(unittest.TestCase):
+    def test_failing_rows_do_not_discard_other_targets(self):
+        suffix = str(time.time_ns())
+        pid, round_id = f"p-{suffix}", f"r-{suffix}"
+        now = time.time_ns()
+        batch = [
+            (db._INSERT_PLAYER_SQL, (pid, "Writer"), now),
+            # Postgres rejects NUL bytes in text, so the actions COPY fails
+            (db._COPY_ACTIONS, ("order", round_id, "o1", pid, "buy", "spa\x00des", 20, 10), now),
+            (db._COPY_TRADES, (round_id, pid, "other", "spades", 12, 10), now),
+        ]
+        with self.assertLogs("figgie_server.db", level="ERROR"):
+            db._write_batch(batch)
+        with db.pooled_connection() as conn:
+            players = conn.execute("SELECT name FROM players WHERE player_id = %s", (pid,)).fetchall()
+            actions = conn.execute("SELECT 1 FROM actions WHERE round_id = %s", (round_id,)).fetchall()
+            trades = conn.execute("SELECT price FROM trades WHERE round_id = %s", (round_id,)).fetchall()
+        self.assertEqual(players, [("Writer",)])
+        self.assertEqual(actions, [])
+        self.assertEqual(trades, [(12,)])
+
+    def test_round_end_is_queued_behind_round_events(self):
+        suffix = str(time.time_ns())
+        pid, round_id = f"p-{suffix}", f"r-{suffix}"
+        # Hold the writer so the round end can only be queued, not written
+        release = threading.Event()
+        db._enqueue_call(release.wait, 5.0)
+        db.log_player(pid, "Ender")
+        db.log_round_start(round_id, 4, 60, "hearts", "clubs")
+        started = time.monotonic()
+        db.log_round_end(
+            round_id,
+            {"bonuses": {pid: 10}, "winners": [pid], "share_each": 100},
+            {pid: 300}, {pid: 410},
+            {pid: {"hearts": 1}}, {pid: {"hearts": 1}},
+        )
+        self.assertLess(time.monotonic() - started, 0.5)
+        release.set()
+        self.assertTrue(db.flush(5.0))
+        with db.pooled_connection() as conn:
+            rounds = conn.execute(
+                "SELECT goal_suit, end_time IS NOT NULL FROM rounds WHERE round_id = %s", (round_id,)
+            ).fetchall()
+            results = conn.execute(
+                "SELECT r.final_balance, r.is_winner, p.name FROM results r"
+                " JOIN players p USING (player_id) WHERE r.round_id = %s", (round_id,)
+            ).fetchall()
+        self.assertEqual(rounds, [("hearts", True)])
+        self.assertEqual(results, [(410, True, "Ender")])
+
@@ -20,36 +20,32 @@ def dummy_factory_pos(name, server_url, polling_rate):
     # only positional
     return DummyAgent(server_url=server_url, name=name, polling_rate=polling_rate, foo="pos")
 
-def test_make_agent_class(monkeypatch):
-    # create a fake module with DummyAgent
-    mod = types.SimpleNamespace(DummyAgent=DummyAgent)
-    monkeypatch.setattr(importlib, "import_module", lambda path: mod)
-    entry = dispatcher.AgentConfig("dummy_module", "DummyAgent", 0.1, {"foo": 42})
+FAKE_MOD = types.SimpleNamespace(
+    DummyAgent=DummyAgent,
+    my_factory=dummy_factory_kw,
+    pos_factory=dummy_factory_pos,
+    not_callable=123,
+)
+
+@pytest.fixture(autouse=True)
+def patch_import(monkeypatch):
+    monkeypatch.setattr(importlib, "import_module", lambda path: FAKE_MOD)
+
+@pytest.mark.parametrize("attr, kwargs, expected_foo", [
+    # agent class constructed with keyword args
+    ("DummyAgent", {"foo": 42}, 42),
+    # factory accepting keyword args
+    ("my_factory", {"foo": 7}, 7),
+    # factory(**kwargs) raises TypeError; fallback to positional args should succeed
+    ("pos_factory", {}, "pos"),
+])
+def test_make_agent(attr, kwargs, expected_foo):
+    entry = dispatcher.AgentConfig("dummy_module", attr, 0.1, kwargs)
     inst = dispatcher.make_agent(entry, "X", "http://u", 240)
     assert isinstance(inst, DummyAgent)
-    assert inst.foo == 42
+    assert inst.foo == expected_foo
 
-def test_make_agent_factory_kw(monkeypatch):
-    mod = types.SimpleNamespace(my_factory=dummy_factory_kw)
-    monkeypatch.setattr(importlib, "import_module", lambda path: mod)
-    entry = dispatcher.AgentConfig("dummy_module", "my_factory", 0.2, {"foo": 7})
-    inst = dispatcher.make_agent(entry, "Y", "http://u", 240)
-    assert isinstance(inst, DummyAgent)
-    assert inst.foo == 7
-
-def test_make_agent_factory_pos_fallback(monkeypatch):
-    # Test fallback for a factory that only accepts positional args
-    mod = types.SimpleNamespace(pos_factory=dummy_factory_pos)
-    monkeypatch.setattr(importlib, "import_module", lambda path: mod)
-    # First attempt factory(**kwargs) will raise TypeError; fallback to positional args should succeed
-    entry = dispatcher.AgentConfig("dummy_module", "pos_factory", 0.3, {})
-    inst = dispatcher.make_agent(entry, "Z", "http://u", 240)
-    assert isinstance(inst, DummyAgent)
-    assert inst.foo == "pos"
-
-def test_make_agent_invalid(monkeypatch):
-    mod = types.SimpleNamespace(not_callable=123)
-    monkeypatch.setattr(importlib, "import_module", lambda path: mod)
+def test_make_agent_invalid():
     entry = dispatcher.AgentConfig("dummy_module", "not_callable", 0.1, {})
     with pytest.raises(ValueError):
-        dispatcher.make_agent(entry, "Bad", "http://u", 240)
\ No newline at end of file
+        dispatcher.make_agent(entry, "Bad", "http://u", 240)
@@ -1,8 +1,9 @@
 import unittest
 import time
+import dataclasses
 
 from figgie_server.game import Game, SUITS, TRADING_DURATION
-from figgie_server.models import Order, Player
+from figgie_server.models import Market, Order, Player
 
 class TestGame(unittest.TestCase):
     def setUp(self):
@@ -62,24 +63,26 @@ class TestGame(unittest.TestCase):
         self.assertEqual(err, 'Reject Order')
         self.assertIsNone(match)
 
+    def _assert_rejected(self, cases):
+        # Rejected orders leave the game untouched, so the cases share one game
+        for args, msg in cases:
+            with self.subTest(order=args):
+                res, err = self.game.place_order(self.pid1, *args)
+                self.assertIsNone(res)
+                self.assertIn(msg, err)
+
     def test_place_order_invalid(self):
-        res, err = self.game.place_order(self.pid1, 'hold', SUITS[0], 10)
-        self.assertIsNone(res)
-        self.assertIn('Invalid order_type', err)
-        res, err = self.game.place_order(self.pid1, 'buy', 'invalid', 10)
-        self.assertIsNone(res)
-        self.assertIn('Invalid suit', err)
-        res, err = self.game.place_order(self.pid1, 'buy', SUITS[0], -5)
-        self.assertIsNone(res)
-        self.assertIn('Price must be a positive integer', err)
+        self._assert_rejected([
+            (('hold', SUITS[0], 10), 'Invalid order_type'),
+            (('buy', 'invalid', 10), 'Invalid suit'),
+            (('buy', SUITS[0], -5), 'Price must be a positive integer'),
+        ])
 
     def test_place_order_insufficient(self):
-        res, err = self.game.place_order(self.pid1, 'buy', SUITS[0], 1000)
-        self.assertIsNone(res)
-        self.assertIn('Insufficient funds', err)
-        res, err = self.game.place_order(self.pid1, 'sell', SUITS[0], 10)
-        self.assertIsNone(res)
-        self.assertIn('Not enough cards', err)
+        self._assert_rejected([
+            (('buy', SUITS[0], 1000), 'Insufficient funds'),
+            (('sell', SUITS[0], 10), 'Not enough cards'),
+        ])
 
     def test_place_order_duplicate(self):
         # first order
@@ -123,19 +126,24 @@ class TestGame(unittest.TestCase):
         self.game.markets[suit].bids.append(o1)
         self.game.markets[suit].offers.append(o2)
         res, err = self.game.cancel_order(self.pid1, 'both', 'all', -1)
-        self.assertEqual(set(res['canceled']), {'c1', 'c2'})
+        self.assertEqual(res['canceled'], ['c1', 'c2'])
         self.assertFalse(self.game.orders)
         self.assertFalse(self.game.markets[suit].bids)
         self.assertFalse(self.game.markets[suit].offers)
 
     def test_get_state_various(self):
+        # run on a fixed clock, injected through the constructor
+        now = 1_000_000.0
+        players = self.game.players
+        self.game = Game(clock=lambda: now)
+        self.game.players = players
         # waiting
         st = self.game.get_state(self.pid1)
         self.assertEqual(st['state'], 'waiting')
         self.assertIsNone(st['time_left'])
         # trading half time
         self.game.state = 'trading'
-        self.game.start_time = time.time() - (TRADING_DURATION / 2)
+        self.game.start_time = now - (TRADING_DURATION / 2)
         self.game.pot = 100
         suit = SUITS[0]
         bid = Order(order_id='b1', player_id=self.pid1, type='buy', suit=suit, price=30)
@@ -144,11 +152,11 @@ class TestGame(unittest.TestCase):
         self.game.markets[suit].offers = [ask]
         st2 = self.game.get_state(self.pid1)
         self.assertEqual(st2['state'], 'trading')
-        self.assertTrue(0 < st2['time_left'] < 240)
+        self.assertEqual(st2['time_left'], 120)
         self.assertEqual(st2['market'][suit]['highest_bid']['price'], 30)
         self.assertEqual(st2['market'][suit]['lowest_ask']['price'], 50)
         # expired yields completed
-        self.game.start_time = time.time() - (TRADING_DURATION + 1)
+        self.game.start_time = now - (TRADING_DURATION + 1)
         st3 = self.game.get_state(self.pid1)
         self.assertEqual(st3['state'], 'completed')
         self.assertIn('results', st3)
@@ -170,8 +178,8 @@ class TestGame(unittest.TestCase):
         # verify market.offers sorted in ascending order by price
         offers = self.game.markets[suit].offers
         self.assertEqual([o.price for o in offers], sorted(prices))
-        # verify orders dict contains all placed orders
-        self.assertEqual(set(order_ids), set(self.game.orders.keys()))
+        # verify orders dict holds the placed orders, in placement order
+        self.assertEqual(list(self.game.orders), order_ids)
 
     def test_same_price_bid_priority(self):
         # two buyers place bids at the same price; the one who bid first should win
@@ -260,3 +268,17 @@ class TestGame(unittest.TestCase):
         # after expiration, state should be completed and results set
         self.assertEqual(game.state, 'completed')
         self.assertIsInstance(game.results, dict)
+
+    def test_market_add_and_remove_keep_price_time_priority(self):
+        market = Market()
+        b1 = Order(order_id='b1', player_id='p1', type='buy', suit='spades', price=20)
+        b2 = Order(order_id='b2', player_id='p2', type='buy', suit='spades', price=30)
+        b3 = Order(order_id='b3', player_id='p3', type='buy', suit='spades', price=20)
+        for o in (b1, b2, b3):
+            market.add(o)
+        self.assertEqual([o.order_id for o in market.bids], ['b2', 'b1', 'b3'])
+        # removal is by identity, so an equal-looking order is not removed
+        self.assertFalse(market.remove(dataclasses.replace(b1)))
+        self.assertTrue(market.remove(b1))
+        self.assertEqual([o.order_id for o in market.bids], ['b2', 'b3'])
+        self.assertFalse(market.remove(b1))
@@ -1,8 +1,13 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 from agents.figgie_interface import FiggieInterface, State, Order, Trade
 
+def _response(payload) -> SimpleNamespace:
+    """Stand-in for a successful requests.Response returning payload as JSON."""
+    return SimpleNamespace(raise_for_status=lambda: None, json=lambda: payload)
+
 class TestFiggieInterface(unittest.TestCase):
     def setUp(self):
         self.server_url = "http://testserver"
@@ -16,20 +21,14 @@ class TestFiggieInterface(unittest.TestCase):
             "time_left": None,
         }
 
-    def _make_join_response(self) -> MagicMock:
-        join_resp = MagicMock()
-        join_resp.raise_for_status.return_value=None
-        join_resp.json.return_value={'player_id': self.player_id}
-        return join_resp
+    def _make_join_response(self) -> SimpleNamespace:
+        return _response({'player_id': self.player_id})
 
     @patch('agents.figgie_interface.requests.post')
     @patch('agents.figgie_interface.FiggieInterface._start_polling')
     def test_init_joins_game_and_starts_polling(self, mock_start, mock_post):
         # join returns player_id
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status.return_value = None
-        mock_resp.json.return_value = {"player_id": self.player_id}
-        mock_post.return_value = mock_resp
+        mock_post.return_value = _response({"player_id": self.player_id})
 
         iface = FiggieInterface(self.server_url, self.agent_name)
         mock_post.assert_called_once_with(
@@ -45,10 +44,7 @@ class TestFiggieInterface(unittest.TestCase):
         join_resp = self._make_join_response()
         mock_post.return_value = join_resp
         # mock get
-        mock_resp = MagicMock()
-        mock_resp.raise_for_status.return_value = None
-        mock_resp.json.return_value = self.initial_state
-        mock_get.return_value = mock_resp
+        mock_get.return_value = _response(self.initial_state)
 
         with patch('agents.figgie_interface.FiggieInterface._start_polling'):
             iface = FiggieInterface(self.server_url, self.agent_name)
@@ -112,9 +108,7 @@ class TestFiggieInterface(unittest.TestCase):
     def test_bid_and_offer_methods(self, mock_start, mock_post):
         # join and action responses
         join_resp = self._make_join_response()
-        action_resp = MagicMock()
-        action_resp.raise_for_status.return_value=None
-        action_resp.json.return_value={'result': 'ok'}
+        action_resp = _response({'result': 'ok'})
         mock_post.side_effect = [join_resp, action_resp]
 
         iface = FiggieInterface(self.server_url, self.agent_name)
@@ -172,9 +166,7 @@ class TestFiggieInterface(unittest.TestCase):
     @patch('agents.figgie_interface.FiggieInterface._start_polling')
     def test_cancel_methods(self, mock_start, mock_post):
         join_resp = self._make_join_response()
-        cancel_resp = MagicMock()
-        cancel_resp.raise_for_status.return_value=None
-        cancel_resp.json.return_value={'canceled': ['id1', 'id2']}
+        cancel_resp = _response({'canceled': ['id1', 'id2']})
         mock_post.side_effect = [join_resp, cancel_resp]
         iface = FiggieInterface(self.server_url, self.agent_name)
         res = iface.cancel_bids_and_offers('t')